@@ -1,12 +1,10 @@
+from primes import primes_in_range
+
 # First, we will take the input:  
 lower_value = int(input ("Please, Enter the Lowest Range Value: "))  
 upper_value = int(input ("Please, Enter the Upper Range Value: "))  
   
 print ("The Prime Numbers in the range are: ")  
-for number in range (lower_value, upper_value + 1):  
-    if number > 1:  
-        for i in range (2, number):  
-            if (number % i) == 0:  
-                break  
-        else:  
-            print (number)  
\ No newline at end of file
+# Segmented sieve instead of testing every number against every smaller one  
+for number in primes_in_range(lower_value, upper_value):  
+    print (number)  
\ No newline at end of file
@@ -1,10 +1,17 @@
+import sys
+
+from factorial import factorial as big_factorial
+
+# Allow printing results with more than 4300 digits  
+if hasattr(sys, "set_int_max_str_digits"):
+    sys.set_int_max_str_digits(0)
+
 num = int(input("Enter a number: "))    
-factorial = 1    
 if num < 0:    
    print(" Factorial does not exist for negative numbers")    
 elif num == 0:    
    print("The factorial of 0 is 1")    
 else:    
-   for i in range(1,num + 1):    
-       factorial = factorial*i    
+   # Binary-splitting prime-swing product instead of multiplying 1..n one by one    
+   factorial = big_factorial(num)    
    print("The factorial of",num,"is",factorial)    
\ No newline at end of file
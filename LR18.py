@@ -1,11 +1,8 @@
+from exponentiation import power
+
 # Function for calculating A raised to the power B
 def power_1(A, B):  
-    if B == 0:  
-        return 1  
-    if B % 2 == 0:  
-        half_power = power_1(A, B // 2)  # Avoid recalculating the same power
-        return half_power * half_power  
-    return A * power_1(A, B // 2) * power_1(A, B // 2)  # Fixed the recursive call
+    return power(A, B)  # Square-and-multiply: O(log B) multiplications
 
 # Function for calculating the number of digits (order) in the number A
 def order_1(A):  
@@ -1,11 +1,7 @@
+from armstrong import armstrong_numbers
+
 lower = int(input("Enter lower range: "))    
 upper = int(input("Enter upper range: "))    
-for num in range(lower,upper + 1):    
-   sum = 0    
-   temp = num    
-   while temp > 0:    
-       digit = temp % 10    
-       sum += digit ** 3    
-       temp //= 10    
-       if num == sum:    
-            print(num)    
\ No newline at end of file
+# Each digit is raised to the number of digits in num, not always to 3
+for num in armstrong_numbers(lower, upper):    
+    print(num)    
@@ -1,16 +1,9 @@
+from gcd_lcm import lcm  
+  
 # defining a function to calculate LCM  
 def calculate_lcm(x, y):  
-    # selecting the greater number  
-    if x > y:  
-        greater = x  
-    else:  
-        greater = y  
-    while(True):  
-        if((greater % x == 0) and (greater % y == 0)):  
-            lcm = greater  
-            break  
-        greater += 1  
-    return lcm    
+    # lcm(x, y) = x / gcd(x, y) * y, with gcd from Euclid's algorithm  
+    return lcm(x, y)    
   
 # taking input from users  
 num1 = int(input("Enter first number: "))  
@@ -1,14 +1,9 @@
+from gcd_lcm import gcd  
+  
 # defining a function to calculate HCF  
 def calculate_hcf(x, y):  
-    # selecting the smaller number  
-    if x > y:  
-        smaller = y  
-    else:  
-        smaller = x  
-    for i in range(1,smaller + 1):  
-        if((x % i == 0) and (y % i == 0)):  
-            hcf = i  
-    return hcf  
+    # Euclid's algorithm instead of trying every number up to the smaller one  
+    return gcd(x, y)  
   
 # taking input from users  
 num1 = int(input("Enter first number: "))  
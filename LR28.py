@@ -1,8 +1,5 @@
-def recur_fibo(n):  
-   if n <= 1:  
-       return n  
-   else:  
-       return(recur_fibo(n-1) + recur_fibo(n-2))  
+from fibonacci import fibonacci_sequence
+
 # take input from the user  
 nterms = int(input("How many terms? "))  
 # check if the number of terms is valid  
@@ -10,5 +7,6 @@ if nterms <= 0:
    print("Plese enter a positive integer")  
 else:  
    print("Fibonacci sequence:")  
-   for i in range(nterms):  
-       print(recur_fibo(i))  
\ No newline at end of file
+   # Stream the terms instead of recomputing each one from scratch  
+   for term in fibonacci_sequence(nterms):  
+       print(term)  
\ No newline at end of file
@@ -1,8 +1,14 @@
+import sys
+
+from factorial import factorial
+
+# Allow printing results with more than 4300 digits  
+if hasattr(sys, "set_int_max_str_digits"):
+    sys.set_int_max_str_digits(0)
+
+# Prime-swing recursion only goes log2(n) deep, so large n no longer hit the recursion limit  
 def recur_factorial(n):  
-   if n == 1:  
-       return n  
-   else:  
-       return n*recur_factorial(n-1)  
+   return factorial(n)  
 # take input from the user  
 num = int(input("Enter a number: "))  
 # check is the number is negative  
@@ -1,9 +1,4 @@
-# Function to calculate power using a loop
-def power(base, exponent):
-    result = 1
-    for _ in range(exponent):
-        result *= base
-    return result
+from exponentiation import power  # Square-and-multiply instead of a loop of multiplications
 
 # Driver code
 base = int(input("Enter the base number: "))
@@ -1,3 +1,5 @@
+from matrix import add  
+  
 X = [[1,2,3],  
      [4,5,6],  
      [7,8,9]]  
@@ -6,13 +8,6 @@ Y = [[10,11,12],
      [13,14,15],  
      [16,17,18]]  
   
-result = [[0,0,0],  
-          [0,0,0],  
-          [0,0,0]]  
-# iterate through rows  
-for i in range(len(X)):  
-   # iterate through columns  
-   for j in range(len(X[0])):  
-       result[i][j] = X[i][j] + Y[i][j]  
+result = add(X, Y)  
 for r in result:  
    print(r)
\ No newline at end of file
@@ -1,12 +1,8 @@
-import cmath  
+from quadratic import solve_one  
 a = float(input('Enter a: '))  
 b = float(input('Enter b: '))  
 c = float(input('Enter c: '))  
   
-# calculate the discriminant  
-d = (b**2) - (4*a*c)  
-  
-# find two solutions  
-sol1 = (-b-cmath.sqrt(d))/(2*a)  
-sol2 = (-b+cmath.sqrt(d))/(2*a)  
-print('The solution are {0} and {1}'.format(sol1,sol2))   
\ No newline at end of file
+# find two solutions with the stable formula (also handles a = 0)  
+sol1, sol2 = solve_one(a, b, c)  
+print('The solution are {0} and {1}'.format(sol1,sol2))
\ No newline at end of file
@@ -1,4 +1,7 @@
-from datetime import datetime, timedelta
+import base64
+import json
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, time, timedelta
 
 class Book:
     def __init__(self, title, author, isbn):
@@ -35,14 +38,105 @@ class Book:
             print(f"The book '{self._title}' has been returned.")
 
 
+class SortedIndex:
+    """Keys kept in sorted order with bisect, mapped to the items they index."""
+    def __init__(self):
+        self._keys = []
+        self._items = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key, item):
+        if key not in self._items:
+            insort(self._keys, key)
+        self._items[key] = item
+
+    def discard(self, key):
+        if self._items.pop(key, None) is None:
+            return
+        i = bisect_left(self._keys, key)
+        del self._keys[i]
+
+    def after(self, key=None, limit=None):
+        """Yield (key, item) pairs strictly after key, at most limit of them."""
+        start = 0 if key is None else bisect_right(self._keys, key)
+        stop = len(self._keys) if limit is None else start + limit
+        i = start
+        while i < min(stop, len(self._keys)):
+            k = self._keys[i]
+            yield k, self._items[k]
+            i += 1
+
+    def between(self, low, high):
+        """Lazily yield items whose key starts with a value in [low, high]."""
+        i = bisect_left(self._keys, (low,))
+        while i < len(self._keys) and self._keys[i][0] <= high:
+            yield self._items[self._keys[i]]
+            i += 1
+
+
 class Library:
+    PAGE_SIZE = 5
+    SORT_FIELDS = {
+        "title": lambda book: book._title.lower(),
+        "author": lambda book: book.author.lower(),
+    }
+
     def __init__(self):
         self.books = []
         self.users = {}
+        self._next_catalog_id = 0
+        # catalog id -> book for every book still in the library.
+        self._catalog = {}
+        self._available = {field: SortedIndex() for field in Library.SORT_FIELDS}
+        self._by_author = {}
+        self._by_due_date = SortedIndex()
+
+    def _catalog_key(self, book, order_by):
+        # The catalog id breaks ties so equal titles/authors keep a stable order.
+        return (Library.SORT_FIELDS[order_by](book), book._catalog_id)
+
+    def _index_book(self, book):
+        # A book removed while on loan stays out of the indexes when returned.
+        if book._catalog_id not in self._catalog:
+            return
+        # Loaned books are indexed by due date, the rest by title and author.
+        if book.is_borrowed:
+            self._by_due_date.add((book.due_date, book._catalog_id), book)
+        else:
+            for field, index in self._available.items():
+                index.add(self._catalog_key(book, field), book)
+
+    def _unindex_book(self, book):
+        if book.is_borrowed:
+            self._by_due_date.discard((book.due_date, book._catalog_id))
+        else:
+            for field, index in self._available.items():
+                index.discard(self._catalog_key(book, field))
+
+    def lend_book(self, book, user_name, duration=14):
+        self._unindex_book(book)
+        try:
+            book.borrow(user_name, duration)
+        finally:
+            self._index_book(book)
+
+    def take_back_book(self, book):
+        self._unindex_book(book)
+        try:
+            book.return_book()
+        finally:
+            self._index_book(book)
 
     def add_book(self, book, admin):
         if admin.is_admin:
+            book._catalog_id = self._next_catalog_id
+            self._next_catalog_id += 1
             self.books.append(book)
+            self._catalog[book._catalog_id] = book
+            self._by_author.setdefault(book.author.lower(), {})[book._catalog_id] = book
+            self._index_book(book)
             print(f"Admin '{admin.name}' added the book '{book._title}' to the library.")
         else:
             print("Only admins can add books.")
@@ -52,6 +146,12 @@ class Library:
             book = self.find_book_by_title(title)
             if book:
                 self.books.remove(book)
+                del self._catalog[book._catalog_id]
+                self._unindex_book(book)
+                same_author = self._by_author[book.author.lower()]
+                del same_author[book._catalog_id]
+                if not same_author:
+                    del self._by_author[book.author.lower()]
                 print(f"Admin '{admin.name}' removed the book '{title}' from the library.")
             else:
                 print(f"No book found with the title '{title}' to remove.")
@@ -79,15 +179,101 @@ class Library:
         else:
             print("Only admins can remove members.")
 
-    def display_available_books(self):
-        print("\nAvailable Books:")
-        available_books = [book for book in self.books if not book.is_borrowed]
-        if not available_books:
+    def list_available_books(self, page_size=PAGE_SIZE, cursor=None, order_by="title"):
+        """Return one page of available books and the cursor for the next page.
+
+        The page is a list of (number, book) pairs. Numbers keep counting across
+        pages, so a number shown on an earlier page still names the same book.
+        next_cursor is None once the last page has been returned.
+        """
+        if order_by not in Library.SORT_FIELDS:
+            raise ValueError(f"Cannot order books by '{order_by}'.")
+        after_key, number = None, 1
+        if cursor is not None:
+            order_by, after_key, number = self._decode_cursor(cursor)
+
+        entries = list(self._available[order_by].after(after_key, page_size + 1))
+        has_more = len(entries) > page_size
+        entries = entries[:page_size]
+        page = [(number + i, book) for i, (_, book) in enumerate(entries)]
+
+        next_cursor = None
+        if has_more:
+            next_cursor = self._encode_cursor(order_by, entries[-1][0], number + len(entries))
+        return page, next_cursor
+
+    def display_available_page(self, page_size=PAGE_SIZE, cursor=None, order_by="title"):
+        page, next_cursor = self.list_available_books(page_size, cursor, order_by)
+        print(f"\nAvailable Books (by {order_by}):")
+        if not page:
             print("No books are currently available.")
+        for number, book in page:
+            print(f"{number}. {book._title} by {book.author}")
+        return page, next_cursor
+
+    def browse_available_books(self, order_by="title"):
+        """Show available books one page at a time until the reader stops."""
+        page, cursor = self.display_available_page(order_by=order_by)
+        while cursor is not None and input("Enter 'n' for the next page: ").strip().lower() == "n":
+            page, cursor = self.display_available_page(cursor=cursor)
+
+    @staticmethod
+    def _encode_cursor(order_by, key, number):
+        payload = json.dumps([order_by, list(key), number]).encode()
+        return base64.urlsafe_b64encode(payload).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        try:
+            order_by, key, number = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if order_by not in Library.SORT_FIELDS:
+                raise ValueError(order_by)
+            return order_by, tuple(key), int(number)
+        except (ValueError, TypeError) as e:
+            raise InvalidCursorError() from e
+
+    def books_by_author(self, author):
+        yield from self._by_author.get(author.lower(), {}).values()
+
+    @staticmethod
+    def _as_datetime(value, end_of_day=False):
+        # A plain date covers the whole day: from its first to its last moment.
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return datetime.combine(value, time.max if end_of_day else time.min)
+        return value
+
+    def loans_due_between(self, start, end):
+        return self._by_due_date.between(self._as_datetime(start), self._as_datetime(end, end_of_day=True))
+
+    def query(self, author=None, due_from=None, due_to=None, available=None):
+        """Lazily yield books matching every given filter.
+
+        The author hash index is used when an author is given, otherwise the
+        due-date index when a due range is given, otherwise the whole catalog
+        is scanned. Remaining filters are checked on each candidate. due_from
+        and due_to may be datetimes or plain dates.
+        """
+        due_from = self._as_datetime(due_from)
+        due_to = self._as_datetime(due_to, end_of_day=True)
+        if author is not None:
+            candidates = self.books_by_author(author)
+        elif due_from is not None or due_to is not None:
+            candidates = self.loans_due_between(due_from or datetime.min, due_to or datetime.max)
+        elif available:
+            candidates = (book for _, book in self._available["title"].after())
         else:
-            for idx, book in enumerate(available_books, start=1):
-                print(f"{idx}. {book._title} by {book.author}")
-        return available_books
+            candidates = iter(self.books)
+
+        for book in candidates:
+            if author is not None and book.author.lower() != author.lower():
+                continue
+            if due_from is not None and (book.due_date is None or book.due_date < due_from):
+                continue
+            if due_to is not None and (book.due_date is None or book.due_date > due_to):
+                continue
+            if available is not None and book.is_borrowed == available:
+                continue
+            yield book
 
     def find_book_by_title(self, title):
         for book in self.books:
@@ -114,15 +300,27 @@ class User:
         if len(self.borrowed_books) >= User.MAX_BORROW_LIMIT:
             raise ExceedBorrowLimitError("Borrow limit reached. Return a book to borrow a new one.")
 
-        available_books = library.display_available_books()
-        if not available_books:
+        # Books seen on every page shown so far, so earlier numbers stay valid.
+        shown = {}
+        page, cursor = library.display_available_page()
+        if not page:
             print("No books available to borrow.")
             return
 
-        choice = int(input("Enter the number of the book you want to borrow: ")) - 1
-        if 0 <= choice < len(available_books):
-            book = available_books[choice]
-            book.borrow(self.name, duration)
+        while True:
+            shown.update(page)
+            prompt = "Enter the number of the book you want to borrow"
+            if cursor is not None:
+                prompt += " or 'n' for the next page"
+            choice = input(prompt + ": ").strip()
+            if choice.lower() == "n" and cursor is not None:
+                page, cursor = library.display_available_page(cursor=cursor)
+                continue
+            break
+
+        book = shown.get(int(choice))
+        if book is not None and not book.is_borrowed:
+            library.lend_book(book, self.name, duration)
             self.borrowed_books.append(book)
             print(f"{self.name} borrowed '{book._title}'.")
         else:
@@ -140,7 +338,7 @@ class User:
         choice = int(input("Enter the number of the book you want to return: ")) - 1
         if 0 <= choice < len(self.borrowed_books):
             book = self.borrowed_books[choice]
-            book.return_book()
+            library.take_back_book(book)
             self.borrowed_books.remove(book)
             print(f"{self.name} returned '{book._title}'.")
         else:
@@ -180,6 +378,10 @@ class NotAMemberError(Exception):
     def __init__(self, message="User is not a registered member. Please register first."):
         super().__init__(message)
 
+class InvalidCursorError(Exception):
+    def __init__(self, message="The page cursor is invalid or has expired."):
+        super().__init__(message)
+
 
 def main():
     library = Library()
@@ -193,7 +395,7 @@ def main():
     library.add_book(Book("Big Data Concepts", "Chris Taylor", "3456789012345"), admin)
 
     print("\nInitial set of books added to the library.")
-    library.display_available_books()
+    library.display_available_page()
 
 
     while True:
@@ -257,7 +459,7 @@ def main():
                     print("Invalid credentials. Please try again.")
 
             elif choice == "8":  # Display Available Books
-                library.display_available_books()
+                library.browse_available_books()
 
             elif choice == "9":  # Exit
                 print("Exiting the Library Management System. Goodbye!")
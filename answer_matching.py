@@ -0,0 +1,115 @@
+"""Lenient quiz answer matching with answer keys compiled once.
+
+An answer is compiled into the set of normalized forms it accepts (itself
+plus any synonym group it belongs to) and a deletion index of those forms
+for typo tolerance. Checking a submission is a set lookup, then at most a
+fixed number of dictionary lookups over the submission's own deletion
+variants, so the cost does not grow with the number of accepted forms.
+"""
+import string
+
+# Each group is a set of answers treated as equal, written in normalized form.
+SYNONYM_GROUPS = [
+    {"yes", "y"},
+    {"no", "n"},
+    {"index 0", "0", "[0]", "zero", "first index"},
+    {"str", "string"},
+    {"int", "integer"},
+    {"boolean", "bool"},
+    {"float", "floating point"},
+    {"dictionary", "dict"},
+    {"parentheses", "parenthesis", "()", "round brackets"},
+    {"true and false", "false and true", "true false", "true or false"},
+    {"triple quotes", '"""', "'''"},
+    {"explaining code", "explain code", "explanation"},
+    {"parent", "parent class", "base class", "superclass"},
+    {"numpy", "np"},
+]
+
+_PUNCTUATION = str.maketrans("", "", string.punctuation)
+
+
+def normalize(text):
+    """Lowercase, spell out '&', drop punctuation and collapse whitespace.
+
+    Answers made only of symbols ("==", "#", "()") keep their symbols.
+    """
+    text = str(text).lower().replace("&", " and ")
+    words = text.translate(_PUNCTUATION).split()
+    if not words:
+        words = text.split()
+    return " ".join(words)
+
+
+def max_edits(text):
+    """Typos tolerated for an accepted form: none for short words or symbols."""
+    if len(text) < 5 or not any(ch.isalpha() for ch in text):
+        return 0
+    return 1 if len(text) < 9 else 2
+
+
+def _deletions(text, edits):
+    """Every string reachable from text by deleting up to edits characters."""
+    found = {text}
+    frontier = {text}
+    for _ in range(edits):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        found |= frontier
+    return found
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance of a and b, or limit + 1 once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ch_a in enumerate(a, start=1):
+        current = [i]
+        for j, ch_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ch_a != ch_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+_SYNONYMS = {}
+for _group in SYNONYM_GROUPS:
+    for _form in _group:
+        _SYNONYMS[_form] = _group
+
+
+class CompiledAnswer:
+    """One quiz answer prepared for repeated matching."""
+    def __init__(self, answer, synonyms=True, typos=True):
+        self.answer = answer
+        canonical = normalize(answer)
+        self.accepted = {canonical}
+        if synonyms:
+            self.accepted |= _SYNONYMS.get(canonical, set())
+
+        self.max_edits = max((max_edits(form) for form in self.accepted), default=0) if typos else 0
+        self._max_length = max(len(form) for form in self.accepted) + self.max_edits
+        self._deletion_index = {}
+        if self.max_edits:
+            for form in self.accepted:
+                for variant in _deletions(form, max_edits(form)):
+                    self._deletion_index.setdefault(variant, set()).add(form)
+
+    def matches(self, given):
+        given = normalize(given)
+        if given in self.accepted:
+            return True
+        if not self.max_edits or len(given) > self._max_length:
+            return False
+        for variant in _deletions(given, self.max_edits):
+            for form in self._deletion_index.get(variant, ()):
+                limit = max_edits(form)
+                if edit_distance(given, form, limit) <= limit:
+                    return True
+        return False
+
+
+def compile_quiz(quiz):
+    """Compile the answers of a [(question, answer), ...] quiz."""
+    return [CompiledAnswer(answer) for _, answer in quiz]
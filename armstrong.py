@@ -0,0 +1,138 @@
+"""Armstrong (narcissistic) number search over large ranges.
+
+A k-digit number n is an Armstrong number when the sum of its digits each
+raised to the k-th power equals n. Each k-digit number is split as
+n = high * 10**m + low. The digit-power sums of every low part are
+computed once with vectorized digit extraction against a digit**k lookup
+table. The values S(low) - low are then sorted. For a chunk of high parts
+the matching lows are exactly those with
+S(low) - low == high * 10**m - S(high), which np.searchsorted finds for
+the whole chunk at once. Finding every Armstrong number below 10**10
+therefore costs about 10**5 work per digit count, not 10**10.
+
+    python armstrong.py 1 10000000000 --workers 4
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python search with a dict join instead
+    np = None
+
+LOW_DIGITS = 5
+CHUNK = 1 << 16
+# Exclusive bound on the search so every sum and product fits in int64.
+MAX_UPPER = 10**18
+
+
+def _digit_power_sums(values, digits, powers):
+    """Sum of powers[d] over the `digits` lowest decimal digits of each value."""
+    total = np.zeros(values.shape, dtype=np.int64)
+    rest = values.copy()
+    for _ in range(digits):
+        total += powers[rest % 10]
+        rest //= 10
+    return total
+
+
+def _low_table(k, m):
+    powers = np.arange(10, dtype=np.int64) ** k
+    lows = np.arange(10 ** m, dtype=np.int64)
+    diff = _digit_power_sums(lows, m, powers) - lows
+    order = np.argsort(diff, kind="stable")
+    return powers, diff[order], lows[order]
+
+
+def _search_highs(k, m, high_start, high_stop):
+    """Armstrong numbers with k digits whose high part lies in [high_start, high_stop)."""
+    powers, sorted_diff, sorted_lows = _low_table(k, m)
+    scale = 10 ** m
+    smallest = 10 ** (k - 1)
+    found = []
+    for start in range(high_start, high_stop, CHUNK):
+        highs = np.arange(start, min(start + CHUNK, high_stop), dtype=np.int64)
+        target = highs * scale - _digit_power_sums(highs, k - m, powers)
+        left = np.searchsorted(sorted_diff, target, side="left")
+        right = np.searchsorted(sorted_diff, target, side="right")
+        for i in np.flatnonzero(right > left):
+            for j in range(left[i], right[i]):
+                n = int(highs[i]) * scale + int(sorted_lows[j])
+                if n >= smallest:
+                    found.append(n)
+    return found
+
+
+def _search_digits_python(k, m):
+    powers = [d ** k for d in range(10)]
+    by_diff = {}
+    for low in range(10 ** m):
+        total, rest = 0, low
+        for _ in range(m):
+            total += powers[rest % 10]
+            rest //= 10
+        by_diff.setdefault(total - low, []).append(low)
+    found = []
+    scale = 10 ** m
+    for high in range(10 ** (k - m - 1) if k > m else 0, 10 ** (k - m)):
+        total, rest = 0, high
+        for _ in range(k - m):
+            total += powers[rest % 10]
+            rest //= 10
+        for low in by_diff.get(high * scale - total, ()):
+            if high * scale + low >= 10 ** (k - 1):
+                found.append(high * scale + low)
+    return found
+
+
+def _tasks(k, workers):
+    m = min(k, LOW_DIGITS)
+    high_start = 10 ** (k - m - 1) if k > m else 0
+    high_stop = 10 ** (k - m)
+    step = max(1, -(-(high_stop - high_start) // workers))
+    return [(k, m, lo, min(lo + step, high_stop)) for lo in range(high_start, high_stop, step)]
+
+
+def armstrong_numbers(lower, upper, workers=1):
+    """Sorted list of Armstrong numbers n with lower <= n <= upper.
+
+    upper must be below 10**18 (at most 18 digits). For 19 digits both
+    19 * 9**19 and high * 10**m overflow the int64 arithmetic without any
+    error, so larger ranges raise ValueError.
+    """
+    if upper >= MAX_UPPER:
+        raise ValueError(f"upper must be below 10**18, got {upper}.")
+    lower = max(lower, 0)
+    if upper < lower:
+        return []
+    found = [0] if lower == 0 else []
+    max_digits = len(str(upper))
+    min_digits = len(str(max(lower, 1)))
+    if np is None:
+        for k in range(min_digits, max_digits + 1):
+            found.extend(_search_digits_python(k, min(k, LOW_DIGITS)))
+    else:
+        tasks = [task for k in range(min_digits, max_digits + 1) for task in _tasks(k, workers)]
+        if workers > 1:
+            with ProcessPoolExecutor(workers) as pool:
+                for part in pool.map(_search_highs, *zip(*tasks)):
+                    found.extend(part)
+        else:
+            for task in tasks:
+                found.extend(_search_highs(*task))
+    return sorted(n for n in found if lower <= n <= upper)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find Armstrong numbers in a range")
+    parser.add_argument("lower", type=int)
+    parser.add_argument("upper", type=int)
+    parser.add_argument("--workers", type=int, default=1, help=f"process pool size (e.g. {os.cpu_count()})")
+    args = parser.parse_args()
+    for number in armstrong_numbers(args.lower, args.upper, args.workers):
+        print(number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Fibonacci benchmark: fast doubling vs linear iteration vs the LR28 recursion.
+
+    python bench_fibonacci.py --max-exponent 7
+"""
+import argparse
+import time
+
+from fibonacci import _fib_pair, fib_mod
+
+
+def recur_fibo(n):
+    # LR28's exponential-time recursion, for comparison on small n.
+    if n <= 1:
+        return n
+    return recur_fibo(n - 1) + recur_fibo(n - 2)
+
+
+def linear_fib(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def timed(func, n):
+    start = time.perf_counter()
+    result = func(n)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Fibonacci algorithms")
+    parser.add_argument("--max-exponent", type=int, default=7, help="largest n is 10**max_exponent")
+    parser.add_argument("--linear-limit", type=int, default=10**6, help="skip linear iteration above this n")
+    args = parser.parse_args()
+
+    print("n=25 recursive (LR28): {:.3f}s".format(timed(recur_fibo, 25)[1]))
+    for exponent in range(1, args.max_exponent + 1):
+        n = 10 ** exponent
+        # _fib_pair bypasses the memo so repeated runs measure the real work.
+        value, fast = timed(lambda k: _fib_pair(k)[0], n)
+        line = f"n=10^{exponent}: fast doubling {fast:.4f}s ({value.bit_length()} bits)"
+        if n <= args.linear_limit:
+            linear_value, linear = timed(linear_fib, n)
+            assert linear_value == value
+            line += f", linear {linear:.4f}s"
+        print(line)
+    _, elapsed = timed(lambda k: fib_mod(k, 10**9 + 7, use_period=False), 10**18)
+    print(f"F(10^18) mod 1e9+7: {elapsed * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""GCD/LCM benchmark: LR23/LR24 loops vs Euclid, binary GCD and NumPy arrays.
+
+    python bench_gcd.py --pairs 50 --max-value 1000 --size 1000000
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from gcd_lcm import binary_gcd, gcd, gcd_array, lcm, lcm_array, lcm_reduce
+
+
+def calculate_lcm(x, y):
+    # LR23's search upward from the larger number, for comparison.
+    greater = max(x, y)
+    while greater % x or greater % y:
+        greater += 1
+    return greater
+
+
+def calculate_hcf(x, y):
+    # LR24's trial of every candidate up to the smaller number.
+    hcf = 1
+    for i in range(1, min(x, y) + 1):
+        if x % i == 0 and y % i == 0:
+            hcf = i
+    return hcf
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GCD and LCM implementations")
+    parser.add_argument("--pairs", type=int, default=50, help="pairs for the LR23/LR24 loops")
+    parser.add_argument("--max-value", type=int, default=1000)
+    parser.add_argument("--size", type=int, default=10**6, help="elements in the vectorized run")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    pairs = [(rng.randint(1, args.max_value), rng.randint(1, args.max_value)) for _ in range(args.pairs)]
+    expected_gcd, _ = timed(lambda: [gcd(x, y) for x, y in pairs])
+    expected_lcm, _ = timed(lambda: [lcm(x, y) for x, y in pairs])
+    print(f"{args.pairs} pairs up to {args.max_value}:")
+    for name, func, expected in (
+        ("LR24 calculate_hcf", calculate_hcf, expected_gcd),
+        ("gcd (Euclid)", gcd, expected_gcd),
+        ("binary_gcd", binary_gcd, expected_gcd),
+        ("LR23 calculate_lcm", calculate_lcm, expected_lcm),
+        ("lcm", lcm, expected_lcm),
+    ):
+        result, elapsed = timed(lambda: [func(x, y) for x, y in pairs])
+        assert result == expected
+        print(f"  {name:<20} {elapsed * 1e6 / args.pairs:10.2f}us/pair")
+
+    generator = np.random.default_rng(1)
+    a = generator.integers(1, 2**31, args.size, dtype=np.int64)
+    b = generator.integers(1, 2**31, args.size, dtype=np.int64)
+    sample = range(0, args.size, max(1, args.size // 1000))
+    gcds, elapsed = timed(gcd_array, a, b)
+    assert all(gcds[i] == gcd(int(a[i]), int(b[i])) for i in sample)
+    print(f"gcd_array over {args.size} pairs: {elapsed:.3f}s ({elapsed * 1e9 / args.size:.1f}ns/pair)")
+    lcms, elapsed = timed(lcm_array, a, b)
+    assert all(lcms[i] == lcm(int(a[i]), int(b[i])) for i in sample)
+    print(f"lcm_array over {args.size} pairs: {elapsed:.3f}s ({elapsed * 1e9 / args.size:.1f}ns/pair)")
+    small = generator.integers(1, 40, args.size, dtype=np.int64)
+    value, elapsed = timed(lcm_reduce, small)
+    print(f"lcm_reduce over {args.size} values below 40: {value} in {elapsed:.3f}s")
+    try:
+        lcm_reduce(a)
+    except OverflowError:
+        print("lcm_reduce over the random int64 values: overflow detected")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Signup/login load benchmark for the Python learning program.
+
+Runs UserManager and LessonHandler non-interactively against N synthetic
+users in a scratch directory and reports signups/s, logins/s, lesson
+completions/s, a full save_users snapshot, bytes written per operation
+and total time. Results are appended to a JSON file for comparison.
+
+    python bench_learn.py --sizes 1000 100000 1000000 --write-behind --out bench_learn.json
+"""
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+from python_learn import LessonHandler, UserManager, lesson_store
+
+
+def bytes_written():
+    """Bytes this process has written so far (Linux /proc), or None elsewhere."""
+    try:
+        with open("/proc/self/io", "r") as file:
+            for line in file:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except IOError:
+        pass
+    return None
+
+
+@contextlib.contextmanager
+def measure(results, name, ops):
+    start_bytes = bytes_written()
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    end_bytes = bytes_written()
+    entry = {"ops": ops, "seconds": round(elapsed, 4), "ops_per_sec": round(ops / elapsed, 1) if elapsed else None}
+    if start_bytes is not None:
+        entry["bytes_per_op"] = round((end_bytes - start_bytes) / ops, 1)
+    results[name] = entry
+
+
+def complete_lessons(usernames, lesson_id):
+    """Take one lesson's quiz through LessonHandler.view_lesson with scripted answers."""
+    handler = LessonHandler(lesson_store)
+    category = lesson_store.find_category(lesson_id)
+    answers = [answer for _, answer in lesson_store.load(lesson_id)["quiz"]]
+    users = UserManager._UserManager__users
+    real_input = builtins.input
+    try:
+        for username in usernames:
+            scripted = iter([""] + answers)
+            builtins.input = lambda prompt="": next(scripted)
+            with contextlib.redirect_stdout(io.StringIO()):
+                handler.view_lesson(category, lesson_id, users[username]["progress"], username)
+    finally:
+        builtins.input = real_input
+
+
+def run_size(size, write_behind, sample, workdir):
+    UserManager.progress_file = os.path.join(workdir, f"users-{size}.json")
+    UserManager.load_users()
+    if write_behind:
+        UserManager.start_write_behind()
+    names = [f"user{i}" for i in range(size)]
+    sampled = names[:: max(1, size // sample)][:sample]
+    results = {"users": size, "write_behind": write_behind}
+    total_start = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        with measure(results, "signup", size):
+            for name in names:
+                UserManager.add_user(name, "secret")
+            UserManager.flush()
+        with measure(results, "login", size):
+            for name in names:
+                UserManager.authenticate_user(name, "secret")
+    with measure(results, "complete_lesson", len(sampled)):
+        complete_lessons(sampled, "1")
+        UserManager.flush()
+    with measure(results, "save_users", 1):
+        UserManager.save_users()
+
+    if write_behind:
+        UserManager.stop_write_behind()
+    results["total_seconds"] = round(time.perf_counter() - total_start, 3)
+    results["users_json_bytes"] = os.path.getsize(UserManager.progress_file)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark UserManager signup/login as the user count grows")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--write-behind", action="store_true", help="batch saves through the write-behind flusher")
+    parser.add_argument("--sample", type=int, default=1000, help="users who take a lesson quiz per size")
+    parser.add_argument("--out", default="bench_learn.json")
+    args = parser.parse_args()
+
+    runs = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            result = run_size(size, args.write_behind, args.sample, workdir)
+            runs.append(result)
+            print(f"{size} users: " + ", ".join(
+                f"{name} {result[name]['ops_per_sec']}/s ({result[name].get('bytes_per_op', '?')} B/op)"
+                for name in ("signup", "login", "complete_lesson", "save_users")
+            ) + f", total {result['total_seconds']}s")
+
+    history = []
+    if os.path.exists(args.out):
+        with open(args.out, "r") as file:
+            history = json.load(file)
+    history.append({"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "runs": runs})
+    with open(args.out, "w") as file:
+        json.dump(history, file, indent=2)
+    print(f"Results saved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
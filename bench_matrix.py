@@ -0,0 +1,66 @@
+"""Matrix multiply/transpose benchmark from 3x3 up to 4096x4096.
+
+Compares the LR32-style triple loop, the blocked pure-Python multiply and
+the NumPy backend. The Python loops are O(n**3) interpreted steps, so they
+are skipped above --python-limit.
+
+    python bench_matrix.py --sizes 3 16 64 256 1024 4096 --python-limit 256
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from matrix import multiply, transpose
+
+
+def naive_multiply(a, b):
+    # LR32's i-j-k loop over a zero-filled result, for comparison.
+    result = [[0] * len(b[0]) for _ in range(len(a))]
+    for m in range(len(a)):
+        for n in range(len(b[0])):
+            for o in range(len(b)):
+                result[m][n] += a[m][o] * b[o][n]
+    return result
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark matrix multiply and transpose")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 16, 64, 256, 1024, 4096])
+    parser.add_argument("--python-limit", type=int, default=256, help="largest n for the pure-Python loops")
+    parser.add_argument("--naive-limit", type=int, default=128, help="largest n for the LR32 triple loop")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    for n in args.sizes:
+        line = []
+        a_array = np.random.default_rng(n).random((n, n))
+        b_array = np.random.default_rng(n + 1).random((n, n))
+        expected, elapsed = timed(multiply, a_array, b_array, backend="numpy")
+        line.append(f"numpy {elapsed:.4f}s ({2 * n**3 / elapsed / 1e9:.2f} GFLOP/s)")
+        if n <= args.python_limit:
+            a = [[rng.randint(-9, 9) for _ in range(n)] for _ in range(n)]
+            b = [[rng.randint(-9, 9) for _ in range(n)] for _ in range(n)]
+            blocked, elapsed = timed(multiply, a, b, backend="python")
+            line.append(f"blocked python {elapsed:.4f}s")
+            if n <= args.naive_limit:
+                naive, elapsed = timed(naive_multiply, a, b)
+                assert naive == blocked
+                line.append(f"LR32 loop {elapsed:.4f}s")
+            assert np.array_equal(np.asarray(blocked), np.asarray(a) @ np.asarray(b))
+        original = a_array.copy()
+        _, elapsed = timed(transpose, a_array, in_place=True)
+        assert np.array_equal(a_array, original.T)
+        line.append(f"in-place transpose {elapsed:.4f}s")
+        print(f"{n}x{n}: " + ", ".join(line))
+
+
+if __name__ == "__main__":
+    main()
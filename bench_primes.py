@@ -0,0 +1,43 @@
+"""Serial vs parallel prime enumeration benchmark.
+
+    python bench_primes.py --lower 1000000000 --upper 1100000000 --workers 1 4 16
+"""
+import argparse
+import os
+import time
+
+from primes import count_primes_in_range, parallel_primes_in_range, primes_in_range
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare serial and parallel segmented sieves")
+    parser.add_argument("--lower", type=int, default=10**9)
+    parser.add_argument("--upper", type=int, default=10**9 + 10**8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1])
+    parser.add_argument("--stream", action="store_true", help="also time streaming every prime back in order")
+    args = parser.parse_args()
+
+    print(f"Range [{args.lower}, {args.upper}]")
+    serial_count, serial_time = timed(count_primes_in_range, args.lower, args.upper, 1)
+    print(f"serial:     {serial_count} primes in {serial_time:.2f}s")
+    for workers in args.workers:
+        count, elapsed = timed(count_primes_in_range, args.lower, args.upper, workers)
+        assert count == serial_count
+        print(f"{workers:>3} workers: {elapsed:.2f}s, speedup {serial_time / elapsed:.2f}x")
+
+    if args.stream:
+        _, elapsed = timed(lambda: sum(1 for _ in primes_in_range(args.lower, args.upper)))
+        print(f"serial stream:   {elapsed:.2f}s")
+        workers = max(args.workers)
+        _, elapsed = timed(lambda: sum(1 for _ in parallel_primes_in_range(args.lower, args.upper, workers)))
+        print(f"parallel stream ({workers} workers): {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Exponentiation by iterative square-and-multiply.
+
+power() and power_mod() need O(log exponent) multiplications, matrix_power()
+does the same for square matrices (nested lists), and vector_power() raises
+whole NumPy arrays of bases to arrays of exponents at once.
+"""
+try:
+    import numpy as np
+except ImportError:  # vector_power falls back to a Python loop
+    np = None
+
+INT64_MAX = 2**63 - 1
+
+
+def power(base, exponent):
+    """base ** exponent for a non-negative integer exponent."""
+    if exponent < 0:
+        raise ValueError("Exponent must be non-negative.")
+    result = 1
+    while exponent:
+        if exponent & 1:
+            result *= base
+        base *= base
+        exponent >>= 1
+    return result
+
+
+def power_mod(base, exponent, modulus):
+    """(base ** exponent) % modulus without building the full power."""
+    if modulus <= 0:
+        raise ValueError("Modulus must be positive.")
+    if exponent < 0:
+        raise ValueError("Exponent must be non-negative.")
+    result = 1 % modulus
+    base %= modulus
+    while exponent:
+        if exponent & 1:
+            result = result * base % modulus
+        base = base * base % modulus
+        exponent >>= 1
+    return result
+
+
+def _mat_mult(a, b, modulus=None):
+    columns = list(zip(*b))
+    result = [[sum(x * y for x, y in zip(row, column)) for column in columns] for row in a]
+    if modulus is not None:
+        result = [[value % modulus for value in row] for row in result]
+    return result
+
+
+def matrix_power(matrix, exponent, modulus=None):
+    """matrix ** exponent for a square nested-list matrix, optionally mod modulus."""
+    size = len(matrix)
+    if any(len(row) != size for row in matrix):
+        raise ValueError("Matrix must be square.")
+    if exponent < 0:
+        raise ValueError("Exponent must be non-negative.")
+    result = [[int(i == j) for j in range(size)] for i in range(size)]
+    base = [list(row) for row in matrix]
+    while exponent:
+        if exponent & 1:
+            result = _mat_mult(result, base, modulus)
+        base = _mat_mult(base, base, modulus)
+        exponent >>= 1
+    return result
+
+
+def _checked_multiply(a, b):
+    """Elementwise int64 a * b; raises OverflowError if any product exceeds INT64_MAX."""
+    limit = np.full(b.shape, INT64_MAX, dtype=np.int64)
+    nonzero = b != 0
+    limit[nonzero] //= np.abs(b[nonzero])
+    if (np.abs(a) > limit).any():
+        raise OverflowError("Power does not fit in int64; pass a modulus or use power().")
+    return a * b
+
+
+def vector_power(bases, exponents, modulus=None):
+    """Elementwise bases ** exponents (mod modulus) over arrays.
+
+    All elements are squared and multiplied together, one pass per exponent
+    bit, so the work is O(log max exponent) vector operations. Values are
+    int64: without a modulus every multiply is checked and OverflowError is
+    raised once a magnitude would pass 2**63 - 1; with one, modulus must stay
+    below 2**31 so products cannot overflow.
+    """
+    if np is None:
+        if modulus is None:
+            return [power(b, e) for b, e in zip(bases, exponents)]
+        return [power_mod(b, e, modulus) for b, e in zip(bases, exponents)]
+
+    base = np.array(bases, dtype=np.int64)
+    exponent = np.array(exponents, dtype=np.int64)
+    base, exponent = np.broadcast_arrays(base, exponent)
+    base = base.copy()
+    exponent = exponent.copy()
+    if (exponent < 0).any():
+        raise ValueError("Exponents must be non-negative.")
+    if modulus is not None:
+        if not 0 < modulus < 2**31:
+            raise ValueError("Modulus must be between 1 and 2**31 for vector_power.")
+        base %= modulus
+    result = np.ones_like(base)
+    if modulus is not None:
+        result %= modulus
+    while exponent.any():
+        odd = (exponent & 1).astype(bool)
+        exponent >>= 1
+        if modulus is None:
+            # Only square bases that still have exponent bits left to use.
+            more = exponent != 0
+            result[odd] = _checked_multiply(result[odd], base[odd])
+            base[more] = _checked_multiply(base[more], base[more])
+        else:
+            result[odd] *= base[odd]
+            base *= base
+            result %= modulus
+            base %= modulus
+    return result
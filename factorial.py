@@ -0,0 +1,114 @@
+"""Big factorials by the prime-swing algorithm, plus n! and nCr modulo a prime.
+
+factorial(n) = factorial(n // 2)**2 * swing(n), where the swing number is a
+product of prime powers read off the sieve. Products are formed by binary
+splitting, so the big multiplications stay balanced, and recent results
+are memoized. FactorialTable precomputes factorials and inverse factorials
+modulo a prime p for fast batches of n! mod p and nCr mod p queries.
+"""
+from functools import lru_cache
+from math import isqrt
+
+from primes import primes_up_to
+
+# Below this, multiplying 1..n directly beats sieving for the swing.
+_SMALL = 64
+
+
+def product(values, lo=0, hi=None):
+    """Product of values[lo:hi] by binary splitting."""
+    hi = len(values) if hi is None else hi
+    if hi - lo <= 8:
+        result = 1
+        for value in values[lo:hi]:
+            result *= value
+        return result
+    mid = (lo + hi) // 2
+    return product(values, lo, mid) * product(values, mid, hi)
+
+
+def swing(n):
+    """The swing number n! / ((n // 2)!)**2."""
+    root = isqrt(n)
+    factors = []
+    for p in primes_up_to(n):
+        if p <= root:
+            # The exponent of p is the sum over i of (n // p**i) mod 2.
+            q, power = n, 1
+            while True:
+                q //= p
+                if q == 0:
+                    break
+                if q & 1:
+                    power *= p
+            if power > 1:
+                factors.append(power)
+        elif (n // p) & 1:
+            factors.append(p)
+    return product(factors)
+
+
+@lru_cache(maxsize=64)
+def factorial(n):
+    if n < 0:
+        raise ValueError("Factorial does not exist for negative numbers.")
+    if n < _SMALL:
+        result = 1
+        for i in range(2, n + 1):
+            result *= i
+        return result
+    half = factorial(n // 2)
+    return half * half * swing(n)
+
+
+class FactorialTable:
+    """n! and nCr modulo a prime p, with tables built once for many queries."""
+    def __init__(self, p, limit=None):
+        self.p = p
+        self.limit = min(p - 1, limit if limit is not None else p - 1)
+        fact = [1] * (self.limit + 1)
+        for i in range(1, self.limit + 1):
+            fact[i] = fact[i - 1] * i % p
+        inv_fact = [1] * (self.limit + 1)
+        inv_fact[self.limit] = pow(fact[self.limit], p - 2, p)
+        for i in range(self.limit, 0, -1):
+            inv_fact[i - 1] = inv_fact[i] * i % p
+        self.fact = fact
+        self.inv_fact = inv_fact
+
+    def factorial(self, n):
+        if n >= self.p:
+            return 0
+        if n <= self.limit:
+            return self.fact[n]
+        result = self.fact[self.limit]
+        for i in range(self.limit + 1, n + 1):
+            result = result * i % self.p
+        return result
+
+    def _small_comb(self, n, r):
+        if r < 0 or r > n:
+            return 0
+        if n <= self.limit:
+            return self.fact[n] * self.inv_fact[r] % self.p * self.inv_fact[n - r] % self.p
+        numerator = denominator = 1
+        for i in range(r):
+            numerator = numerator * (n - i) % self.p
+            denominator = denominator * (i + 1) % self.p
+        return numerator * pow(denominator, self.p - 2, self.p) % self.p
+
+    def comb(self, n, r):
+        """nCr mod p; n >= p is handled digit by digit with Lucas' theorem."""
+        if r < 0 or r > n:
+            return 0
+        result = 1
+        while n or r:
+            result = result * self._small_comb(n % self.p, r % self.p) % self.p
+            if not result:
+                return 0
+            n //= self.p
+            r //= self.p
+        return result
+
+    def comb_many(self, queries):
+        return [self.comb(n, r) for n, r in queries]
@@ -0,0 +1,76 @@
+"""Fibonacci numbers.
+
+fib(n) uses fast doubling, O(log n) big-integer multiplications, and keeps
+recent results in a bounded LRU memo. fib_mod(n, m) runs fast doubling
+modulo m; with use_period=True it first reduces n by the Pisano period of
+m, which pays off only when many huge n share one small modulus.
+fibonacci_sequence() streams terms at O(1) additions per term.
+"""
+from functools import lru_cache
+from itertools import islice
+
+
+def _fib_pair(n, mod=None):
+    """(F(n), F(n + 1)), optionally modulo mod."""
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * (2F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if mod is not None:
+            c %= mod
+            d %= mod
+        if bit == "1":
+            a, b = d, c + d
+            if mod is not None:
+                b %= mod
+        else:
+            a, b = c, d
+    return a, b
+
+
+@lru_cache(maxsize=256)
+def fib(n):
+    if n < 0:
+        # F(-n) = (-1)^(n+1) F(n)
+        return fib(-n) if n % 2 else -fib(-n)
+    return _fib_pair(n)[0]
+
+
+@lru_cache(maxsize=256)
+def pisano_period(m):
+    """Period of the Fibonacci sequence modulo m (at most 6m steps)."""
+    if m == 1:
+        return 1
+    a, b = 0, 1
+    for i in range(1, 6 * m + 1):
+        a, b = b, (a + b) % m
+        if a == 0 and b == 1:
+            return i
+    raise ValueError(f"No Pisano period found for {m}")
+
+
+def fib_mod(n, m, use_period=False):
+    """F(n) mod m, for any integer n.
+
+    use_period=True reduces n by the cached Pisano period of m first; finding
+    that period is an O(6m) loop, so it is opt-in.
+    """
+    if m <= 0:
+        raise ValueError("Modulus must be positive.")
+    if use_period:
+        # The sequence is periodic in both directions, so this also handles n < 0.
+        return _fib_pair(n % pisano_period(m), m)[0]
+    value = _fib_pair(abs(n), m)[0]
+    # F(-n) = (-1)^(n+1) F(n)
+    return (-value) % m if n < 0 and n % 2 == 0 else value
+
+
+def fibonacci_sequence(count=None):
+    """Yield F(0), F(1), ... (forever, or count terms)."""
+    def terms():
+        a, b = 0, 1
+        while True:
+            yield a
+            a, b = b, a + b
+    return terms() if count is None else islice(terms(), count)
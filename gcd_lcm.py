@@ -0,0 +1,108 @@
+"""Greatest common divisor and least common multiple, scalar and batched.
+
+gcd() is Euclid's algorithm and binary_gcd() is Stein's shift-and-subtract
+variant; both take O(log min(a, b)) steps. gcd_array() and lcm_array() work
+elementwise over whole NumPy arrays. gcd_reduce() and lcm_reduce() fold an
+array down to one value. The LCM of many numbers grows fast, so every int64
+LCM step is checked and OverflowError is raised instead of wrapping silently.
+"""
+from functools import reduce
+
+try:
+    import numpy as np
+except ImportError:  # array functions fall back to Python loops over lists
+    np = None
+
+INT64_MAX = 2**63 - 1
+
+
+def gcd(a, b):
+    a, b = abs(a), abs(b)
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def binary_gcd(a, b):
+    a, b = abs(a), abs(b)
+    if a == 0 or b == 0:
+        return a | b
+    # Common factors of two are counted once and restored at the end.
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+
+def lcm(a, b):
+    if a == 0 or b == 0:
+        return 0
+    return abs(a // gcd(a, b) * b)
+
+
+def _checked_lcm(a, b):
+    """Elementwise int64 lcm; raises OverflowError if any result exceeds INT64_MAX."""
+    a = np.abs(np.asarray(a, dtype=np.int64))
+    b = np.abs(np.asarray(b, dtype=np.int64))
+    g = np.gcd(a, b)
+    g[g == 0] = 1
+    quotient = a // g
+    limit = np.full(b.shape, INT64_MAX, dtype=np.int64)
+    nonzero = b != 0
+    limit[nonzero] //= b[nonzero]
+    if (quotient > limit).any():
+        raise OverflowError("LCM does not fit in int64.")
+    return quotient * b
+
+
+def gcd_array(a, b):
+    """Elementwise gcd of two equal-shape (or broadcastable) integer arrays."""
+    if np is None:
+        return [gcd(x, y) for x, y in zip(a, b)]
+    return np.gcd(np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64))
+
+
+def lcm_array(a, b):
+    """Elementwise lcm of two integer arrays, raising OverflowError on int64 overflow."""
+    if np is None:
+        return [lcm(x, y) for x, y in zip(a, b)]
+    return _checked_lcm(a, b)
+
+
+def gcd_reduce(values):
+    """gcd of every value in an array (0 for an empty one)."""
+    if np is None:
+        return reduce(gcd, values, 0)
+    values = np.asarray(values, dtype=np.int64)
+    return int(np.gcd.reduce(np.abs(values))) if values.size else 0
+
+
+def lcm_reduce(values, exact=False):
+    """lcm of every value in an array (1 for an empty one).
+
+    Values are combined pairwise in a tree, so each pass is one vector
+    operation over half the remaining values. If an intermediate LCM
+    exceeds int64, OverflowError is raised. With exact=True the fold
+    continues in Python integers instead.
+    """
+    if np is None:
+        return reduce(lcm, values, 1)
+    level = np.asarray(values, dtype=np.int64).ravel()
+    if level.size == 0:
+        return 1
+    try:
+        while level.size > 1:
+            if level.size % 2:
+                level = np.append(level, 1)
+            level = _checked_lcm(level[0::2], level[1::2])
+            if (level == 0).any():
+                return 0
+    except OverflowError:
+        if not exact:
+            raise
+        return reduce(lcm, (int(value) for value in level), 1)
+    return int(level[0])
@@ -0,0 +1,130 @@
+"""Global and per-category leaderboards over learner scores.
+
+Scores are small bounded integers, so each board is a Fenwick tree of user
+counts per score bucket plus the users in each bucket. Updating a score and
+finding a user's rank are O(log B) for B buckets; the top N users are read
+by walking non-empty buckets downward, each found in O(log B).
+"""
+import threading
+
+from lesson_progress import LessonIndex
+
+# Global score: completed lessons first, quiz accuracy (0-100) breaks ties.
+ACCURACY_BUCKETS = 101
+
+
+class Leaderboard:
+    def __init__(self, max_score):
+        self.size = max_score + 1
+        self.tree = [0] * (self.size + 1)
+        self.buckets = {}
+        self.scores = {}
+
+    def _add(self, score, delta):
+        i = score + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, score):
+        """Users with a score <= score."""
+        total = 0
+        i = min(score, self.size - 1) + 1
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def _lowest_with_prefix(self, count):
+        """Smallest score whose prefix count reaches count (Fenwick binary lifting)."""
+        position = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= self.size and self.tree[nxt] < count:
+                position = nxt
+                count -= self.tree[nxt]
+            step >>= 1
+        # Tree index position + 1 is the first to reach count, and it holds score position.
+        return position
+
+    def __len__(self):
+        return len(self.scores)
+
+    def update(self, user, score):
+        score = max(0, min(score, self.size - 1))
+        old = self.scores.get(user)
+        if old == score:
+            return
+        if old is not None:
+            self._add(old, -1)
+            del self.buckets[old][user]
+        self.scores[user] = score
+        self._add(score, 1)
+        self.buckets.setdefault(score, {})[user] = None
+
+    def remove(self, user):
+        old = self.scores.pop(user, None)
+        if old is not None:
+            self._add(old, -1)
+            del self.buckets[old][user]
+
+    def rank(self, user):
+        """1-based rank; users with equal scores share a rank."""
+        score = self.scores.get(user)
+        if score is None:
+            return None
+        return len(self.scores) - self._prefix(score) + 1
+
+    def top(self, n):
+        """Up to n (user, score) pairs, highest score first."""
+        result = []
+        remaining = len(self.scores)
+        while len(result) < n and remaining:
+            score = self._lowest_with_prefix(remaining)
+            for user in self.buckets[score]:
+                result.append((user, score))
+                if len(result) == n:
+                    break
+            remaining = self._prefix(score - 1) if score else 0
+        return result
+
+
+class LeaderboardService:
+    """Keeps a global board and one board per category in step with user records."""
+    def __init__(self, lessons, lesson_index=None):
+        self.lesson_index = lesson_index or LessonIndex(lessons)
+        lesson_count = sum(len(entries) for entries in lessons.values())
+        self.global_board = Leaderboard((lesson_count + 1) * ACCURACY_BUCKETS)
+        self.category_boards = {category: Leaderboard(len(entries)) for category, entries in lessons.items()}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def global_score(record):
+        stats = record.get("statistics", {})
+        completed = len(record.get("progress", {}))
+        return completed * ACCURACY_BUCKETS + int(stats.get("quiz_accuracy", 0))
+
+    def update_user(self, username, record):
+        mask = self.lesson_index.encode(record.get("progress", {}))
+        counts = self.lesson_index.category_counts(mask)
+        with self._lock:
+            self.global_board.update(username, self.global_score(record))
+            for category, board in self.category_boards.items():
+                board.update(username, counts.get(category, 0))
+
+    def load(self, users):
+        for username, record in users.items():
+            self.update_user(username, record)
+        return self
+
+    def board(self, category=None):
+        return self.global_board if category is None else self.category_boards[category]
+
+    def top(self, n=10, category=None):
+        with self._lock:
+            return self.board(category).top(n)
+
+    def rank(self, username, category=None):
+        with self._lock:
+            return self.board(category).rank(username)
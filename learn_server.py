@@ -0,0 +1,210 @@
+"""Asyncio server for the Python learning program, plus a local load client.
+
+Clients talk newline-delimited JSON over TCP. Every request is an object
+with an "op" field and every reply is an object with "ok" set:
+
+    {"op": "login", "username": ..., "password": ..., "signup": false}
+    {"op": "lessons"}
+    {"op": "lesson", "lesson_id": ...}
+    {"op": "submit", "lesson_id": ..., "answers": [...]}
+    {"op": "progress"}
+
+A connection is one session; after a successful login the other
+operations act on that user only. Saves go through UserManager's
+write-behind queue, so many users' changes are flushed together.
+
+    python learn_server.py serve --port 8765
+    python learn_server.py load --sessions 2000 --concurrency 500
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from answer_matching import compile_quiz
+from python_learn import UserManager, lesson_store
+
+
+class LearnServer:
+    def __init__(self, store, host="127.0.0.1", port=8765):
+        self.store = store
+        self.host = host
+        self.port = port
+        self.server = None
+        self.sessions = 0
+        self._answer_keys = {}
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port, backlog=4096)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        self.sessions += 1
+        session = {"username": None}
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    reply = await self.dispatch(session, json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    reply = {"ok": False, "error": f"Bad request: {e}"}
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, session, request):
+        op = request["op"]
+        if op == "login":
+            return self.login(session, request)
+        if session["username"] is None:
+            return {"ok": False, "error": "Log in first."}
+        if op == "lessons":
+            return {"ok": True, "lessons": self.store.catalog}
+        if op == "lesson":
+            return self.lesson(request["lesson_id"])
+        if op == "submit":
+            return self.submit(session["username"], request["lesson_id"], request["answers"])
+        if op == "progress":
+            return self.progress(session["username"])
+        return {"ok": False, "error": f"Unknown op '{op}'."}
+
+    def login(self, session, request):
+        username, password = request["username"], request["password"]
+        UserManager.refresh_user(username)
+        if request.get("signup") and not UserManager.add_user(username, password):
+            return {"ok": False, "error": "User already exists."}
+        if not UserManager.authenticate_user(username, password):
+            return {"ok": False, "error": "Invalid credentials."}
+        session["username"] = username
+        return {"ok": True, "username": username}
+
+    def lesson(self, lesson_id):
+        if self.store.find_category(lesson_id) is None:
+            return {"ok": False, "error": f"No lesson '{lesson_id}'."}
+        lesson = self.store.load(lesson_id)
+        questions = [question for question, _ in lesson["quiz"]]
+        return {"ok": True, "name": lesson["name"], "content": lesson["content"], "questions": questions}
+
+    def submit(self, username, lesson_id, answers):
+        if self.store.find_category(lesson_id) is None:
+            return {"ok": False, "error": f"No lesson '{lesson_id}'."}
+        keys = self._answer_keys.get(lesson_id)
+        if keys is None:
+            keys = self._answer_keys[lesson_id] = compile_quiz(self.store.load(lesson_id)["quiz"])
+        correct = sum(1 for key, given in zip(keys, answers) if key.matches(given))
+        completed = correct == len(keys)
+        UserManager.record_quiz_result(username, correct, len(keys), lesson_id if completed else None)
+        return {"ok": True, "correct": correct, "total": len(keys), "completed": completed}
+
+    def progress(self, username):
+        user = UserManager._UserManager__users[username]
+        return {"ok": True, "progress": sorted(user["progress"]), "statistics": user["statistics"]}
+
+
+async def run_session(host, port, username, lesson_id, answers):
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def call(**request):
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    try:
+        await call(op="login", username=username, password="load-test", signup=True)
+        await call(op="lessons")
+        await call(op="lesson", lesson_id=lesson_id)
+        await call(op="submit", lesson_id=lesson_id, answers=answers)
+        reply = await call(op="progress")
+        return reply["ok"]
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, sessions, concurrency, store):
+    """Run sessions simulated learners against a server and print throughput."""
+    lesson_ids = [lesson_id for entries in store.catalog.values() for lesson_id in entries]
+    answer_keys = {lesson_id: [answer for _, answer in store.load(lesson_id)["quiz"]] for lesson_id in lesson_ids}
+    limit = asyncio.Semaphore(concurrency)
+    run_id = int(time.time())
+
+    async def one(i):
+        lesson_id = lesson_ids[i % len(lesson_ids)]
+        async with limit:
+            return await run_session(host, port, f"load-{run_id}-{i}", lesson_id, answer_keys[lesson_id])
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(i) for i in range(sessions)), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for result in results if result is True)
+    print(f"Sessions: {sessions} ({ok} ok, {sessions - ok} failed), concurrency {concurrency}")
+    print(f"Elapsed: {elapsed:.2f}s, throughput: {sessions / elapsed:.1f} sessions/s")
+    return {"sessions": sessions, "ok": ok, "elapsed": elapsed, "sessions_per_sec": sessions / elapsed}
+
+
+async def serve(host, port):
+    server = await LearnServer(lesson_store, host, port).start()
+    print(f"Serving on {host}:{server.port}")
+    await server.serve_forever()
+
+
+async def local_load(sessions, concurrency):
+    server = await LearnServer(lesson_store, "127.0.0.1", 0).start()
+    try:
+        return await run_load("127.0.0.1", server.port, sessions, concurrency, lesson_store)
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Python learning program server")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_cmd = sub.add_parser("serve", help="run the server")
+    serve_cmd.add_argument("--host", default="127.0.0.1")
+    serve_cmd.add_argument("--port", type=int, default=8765)
+    serve_cmd.add_argument("--shards", type=int, default=0,
+                           help="store users in this many locked shard files so several servers can share them")
+    load_cmd = sub.add_parser("load", help="run a load test against a local in-process server and scratch user store")
+    load_cmd.add_argument("--sessions", type=int, default=1000)
+    load_cmd.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    if getattr(args, "shards", 0):
+        UserManager.use_shards(count=args.shards)
+    scratch = None
+    if args.command == "load":
+        # Load-test accounts go to a throwaway store, never the real users.json.
+        scratch = tempfile.TemporaryDirectory()
+        UserManager.progress_file = os.path.join(scratch.name, "users.json")
+    UserManager.load_users()
+    UserManager.start_write_behind()
+    try:
+        if args.command == "serve":
+            asyncio.run(serve(args.host, args.port))
+        else:
+            asyncio.run(local_load(args.sessions, args.concurrency))
+    except KeyboardInterrupt:
+        print("\nShutting down.")
+    finally:
+        UserManager.stop_write_behind()
+        if scratch is not None:
+            scratch.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import json
+import os
+
+try:
+    import numpy as np
+except ImportError:  # cohort queries fall back to plain Python ints
+    np = None
+
+
+class LessonIndex:
+    """Stable lesson_id -> bit position table for progress bitsets.
+
+    Positions are handed out in curriculum order and, when a table file is
+    given, saved there, so adding lessons later never moves existing bits.
+    """
+    def __init__(self, lessons, table_file=None):
+        self.table_file = table_file
+        self.positions = {}
+        if table_file and os.path.exists(table_file):
+            with open(table_file, "r") as file:
+                self.positions = json.load(file)
+
+        changed = False
+        for lessons_data in lessons.values():
+            for lesson_id in lessons_data:
+                if lesson_id not in self.positions:
+                    self.positions[lesson_id] = len(self.positions)
+                    changed = True
+        if changed:
+            self._save()
+
+        self.category_masks = {
+            category: self.encode(lessons_data)
+            for category, lessons_data in lessons.items()
+        }
+
+    def _save(self):
+        if self.table_file:
+            with open(self.table_file, "w") as file:
+                json.dump(self.positions, file)
+
+    @property
+    def size(self):
+        return len(self.positions)
+
+    def position(self, lesson_id):
+        """Bit position of lesson_id, assigning the next free one if it is new."""
+        if lesson_id not in self.positions:
+            self.positions[lesson_id] = len(self.positions)
+            self._save()
+        return self.positions[lesson_id]
+
+    def encode(self, progress):
+        """Turn a progress dict (or any iterable of lesson ids) into a bitmask."""
+        mask = 0
+        for lesson_id in progress:
+            position = self.positions.get(lesson_id)
+            if position is not None:
+                mask |= 1 << position
+        return mask
+
+    def decode(self, mask):
+        return {lesson_id: True for lesson_id, position in self.positions.items() if (mask >> position) & 1}
+
+    def is_complete(self, mask, lesson_id):
+        return bool((mask >> self.positions[lesson_id]) & 1)
+
+    def category_counts(self, mask):
+        """Completed lessons per category, one popcount per category."""
+        return {
+            category: (mask & category_mask).bit_count()
+            for category, category_mask in self.category_masks.items()
+        }
+
+
+class ProgressMatrix:
+    """Progress bitsets of many users packed into 64-bit words for bulk queries."""
+    def __init__(self, index, usernames, masks):
+        self.index = index
+        self.usernames = list(usernames)
+        self.words = max(1, (index.size + 63) // 64)
+        if np is not None:
+            self.masks = np.array(
+                [self._split(mask) for mask in masks], dtype=np.uint64
+            ).reshape(len(self.usernames), self.words)
+        else:
+            self.masks = list(masks)
+
+    @classmethod
+    def from_users(cls, index, users):
+        """Build from a UserManager-style {username: {"progress": {...}}} dict."""
+        names = list(users)
+        return cls(index, names, (index.encode(users[name].get("progress", {})) for name in names))
+
+    def _split(self, mask):
+        return [(mask >> (64 * word)) & 0xFFFFFFFFFFFFFFFF for word in range(self.words)]
+
+    def completed_all(self, category):
+        """Usernames who completed every lesson in category."""
+        return self._select(self.index.category_masks[category], require_all=True)
+
+    def completed_any(self, category):
+        return self._select(self.index.category_masks[category], require_all=False)
+
+    def category_counts(self, category):
+        """Completed-lesson count in category for every user, in username order."""
+        category_mask = self.index.category_masks[category]
+        if np is None:
+            return [(mask & category_mask).bit_count() for mask in self.masks]
+        masked = self.masks & np.array(self._split(category_mask), dtype=np.uint64)
+        if hasattr(np, "bitwise_count"):
+            return np.bitwise_count(masked).sum(axis=1)
+        return np.unpackbits(masked.view(np.uint8), axis=1).sum(axis=1)
+
+    def _select(self, category_mask, require_all):
+        if np is None:
+            if require_all:
+                hits = [(mask & category_mask) == category_mask for mask in self.masks]
+            else:
+                hits = [(mask & category_mask) != 0 for mask in self.masks]
+            return [name for name, hit in zip(self.usernames, hits) if hit]
+
+        wanted = np.array(self._split(category_mask), dtype=np.uint64)
+        masked = self.masks & wanted
+        if require_all:
+            hits = np.all(masked == wanted, axis=1)
+        else:
+            hits = np.any(masked != 0, axis=1)
+        return [self.usernames[i] for i in np.flatnonzero(hits)]
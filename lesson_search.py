@@ -0,0 +1,126 @@
+"""BM25 full-text search over lesson names, content and quiz questions.
+
+The inverted index is cached on disk next to the lesson data together with
+the data file's stamp, so an unchanged curriculum loads without reading any
+lesson. Each lesson's entry remembers a hash of its text, so when
+lessons.jsonl changes only the lessons whose text differs are re-tokenized.
+Queries touch only the posting lists of their terms, so query time tracks
+the number of matching lessons rather than the size of the curriculum.
+"""
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+
+_TOKEN = re.compile(r"[a-z0-9_]+")
+
+# Name matches count more than content or quiz matches.
+FIELD_WEIGHTS = {"name": 3, "content": 1, "quiz": 1}
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+class LessonSearch:
+    def __init__(self, store, cache_file=None, k1=1.2, b=0.75):
+        self.store = store
+        self.cache_file = cache_file or os.path.splitext(store.data_file)[0] + ".search.json"
+        if self.cache_file in (store.index_file, store.data_file):
+            raise ValueError(f"Search cache {self.cache_file} would overwrite the lesson store's files.")
+        self.k1 = k1
+        self.b = b
+        self.docs = {}      # lesson_id -> {"hash": ..., "length": ..., "terms": {term: weighted tf}}
+        self.postings = {}  # term -> {lesson_id: weighted tf}
+        self.total_length = 0
+        self.stamp = None
+        self._load_cache()
+        if self.stamp != self.store.stamp:
+            self.refresh()
+            self.stamp = self.store.stamp
+            self._save_cache()
+
+    def _lesson_text(self, lesson_id):
+        lesson = self.store.load(lesson_id)
+        return {
+            "name": lesson["name"],
+            "content": lesson["content"],
+            "quiz": " ".join(question for question, _ in lesson["quiz"]),
+        }
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file, "r") as file:
+                cache = json.load(file)
+            self.docs, self.stamp = cache["docs"], cache["stamp"]
+        except (IOError, ValueError, KeyError):
+            self.docs, self.stamp = {}, None
+        for lesson_id, doc in self.docs.items():
+            self._post(lesson_id, doc["terms"])
+            self.total_length += doc["length"]
+
+    def _save_cache(self):
+        try:
+            with open(self.cache_file, "w") as file:
+                json.dump({"stamp": self.stamp, "docs": self.docs}, file)
+        except IOError as e:
+            print(f"Error saving search index: {e}")
+
+    def _post(self, lesson_id, terms):
+        for term, weight in terms.items():
+            self.postings.setdefault(term, {})[lesson_id] = weight
+
+    def _unpost(self, lesson_id):
+        for term in self.docs[lesson_id]["terms"]:
+            postings = self.postings.get(term, {})
+            postings.pop(lesson_id, None)
+            if not postings:
+                self.postings.pop(term, None)
+        self.total_length -= self.docs[lesson_id]["length"]
+
+    def refresh(self):
+        """Re-index lessons that were added, changed or removed; returns True if any were."""
+        current = {lesson_id for entries in self.store.catalog.values() for lesson_id in entries}
+        changed = False
+        for lesson_id in list(self.docs):
+            if lesson_id not in current:
+                self._unpost(lesson_id)
+                del self.docs[lesson_id]
+                changed = True
+        for lesson_id in current:
+            fields = self._lesson_text(lesson_id)
+            digest = hashlib.sha1(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+            doc = self.docs.get(lesson_id)
+            if doc is not None and doc["hash"] == digest:
+                continue
+            if doc is not None:
+                self._unpost(lesson_id)
+            terms = Counter()
+            for field, text in fields.items():
+                for token in tokenize(text):
+                    terms[token] += FIELD_WEIGHTS[field]
+            self.docs[lesson_id] = {"hash": digest, "length": sum(terms.values()), "terms": dict(terms)}
+            self._post(lesson_id, terms)
+            self.total_length += self.docs[lesson_id]["length"]
+            changed = True
+        return changed
+
+    def search(self, query, limit=10):
+        """Return up to limit (lesson_id, score) pairs, best first."""
+        if not self.docs:
+            return []
+        n = len(self.docs)
+        average_length = self.total_length / n
+        scores = Counter()
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for lesson_id, tf in postings.items():
+                length = self.docs[lesson_id]["length"]
+                norm = tf + self.k1 * (1 - self.b + self.b * length / average_length)
+                scores[lesson_id] += idf * tf * (self.k1 + 1) / norm
+        return scores.most_common(limit)
@@ -0,0 +1,110 @@
+import json
+import os
+from collections import OrderedDict
+
+
+class LessonStore:
+    """Lessons kept on disk in a JSON-lines file and loaded one at a time.
+
+    Each line of data_file holds one lesson:
+        {"category": ..., "id": ..., "name": ..., "content": ..., "quiz": [[question, answer], ...]}
+
+    A small index (category -> lesson id -> name and byte offset) is kept
+    in index_file and rebuilt whenever data_file changes. Only the index is
+    read at startup; a lesson's content and quiz are read on first use and
+    kept in an LRU cache of cache_size lessons.
+    """
+    def __init__(self, data_file, index_file=None, cache_size=32):
+        self.data_file = data_file
+        self.index_file = index_file or os.path.splitext(data_file)[0] + ".idx.json"
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._index = self._load_index()
+        # Names only, shaped like the old lessons dict: {category: {lesson_id: {"name": ...}}}
+        self.catalog = {
+            category: {lesson_id: {"name": entry["name"]} for lesson_id, entry in entries.items()}
+            for category, entries in self._index["categories"].items()
+        }
+        self._offsets = {
+            lesson_id: (entry["offset"], entry["length"])
+            for entries in self._index["categories"].values()
+            for lesson_id, entry in entries.items()
+        }
+
+    @property
+    def stamp(self):
+        """Size and mtime of the data file the index was built from."""
+        return self._index["stamp"]
+
+    def _data_stamp(self):
+        stat = os.stat(self.data_file)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _load_index(self):
+        try:
+            with open(self.index_file, "r") as file:
+                index = json.load(file)
+            if "categories" in index and index.get("stamp") == self._data_stamp():
+                return index
+        except (IOError, json.JSONDecodeError):
+            pass
+        return self.build_index()
+
+    def build_index(self):
+        """Scan data_file once and write the category/offset index."""
+        categories = {}
+        offset = 0
+        with open(self.data_file, "rb") as file:
+            for line in file:
+                if line.strip():
+                    lesson = json.loads(line)
+                    categories.setdefault(lesson["category"], {})[lesson["id"]] = {
+                        "name": lesson["name"],
+                        "offset": offset,
+                        "length": len(line),
+                    }
+                offset += len(line)
+        index = {"stamp": self._data_stamp(), "categories": categories}
+        try:
+            with open(self.index_file, "w") as file:
+                json.dump(index, file)
+        except IOError as e:
+            print(f"Error saving lesson index: {e}")
+        return index
+
+    def load(self, lesson_id):
+        """Return the full lesson dict (name, content, quiz) for lesson_id."""
+        lesson = self._cache.get(lesson_id)
+        if lesson is not None:
+            self._cache.move_to_end(lesson_id)
+            return lesson
+
+        offset, length = self._offsets[lesson_id]
+        with open(self.data_file, "rb") as file:
+            file.seek(offset)
+            record = json.loads(file.read(length))
+        lesson = {
+            "name": record["name"],
+            "content": record["content"],
+            "quiz": [tuple(item) for item in record["quiz"]],
+        }
+        self._cache[lesson_id] = lesson
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return lesson
+
+    def find_category(self, lesson_id):
+        for category, entries in self.catalog.items():
+            if lesson_id in entries:
+                return category
+        return None
+
+
+def write_store(lessons, data_file):
+    """Write a {category: {lesson_id: lesson}} dict out as a lesson data file."""
+    with open(data_file, "w") as file:
+        for category, lessons_data in lessons.items():
+            for lesson_id, lesson in lessons_data.items():
+                record = {"category": category, "id": lesson_id}
+                record.update(lesson)
+                file.write(json.dumps(record) + "\n")
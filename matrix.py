@@ -0,0 +1,119 @@
+"""Matrix add, multiply and transpose for any shape.
+
+Matrices are nested lists (rows of equal length) or NumPy arrays, and
+results come back in the same form. multiply() chooses its backend
+automatically. Large matrices go to NumPy, which calls BLAS for floats.
+Small matrices stay in pure Python, where converting to arrays would cost
+more than the work. So do integer matrices whose products could overflow
+int64, which keeps big integers exact. The pure-Python multiply stores
+the right-hand matrix as columns and takes them BLOCK at a time, so each
+tile stays in cache while every row is dotted against it.
+"""
+from operator import mul
+
+try:
+    import numpy as np
+except ImportError:  # everything runs on the pure-Python paths
+    np = None
+
+BLOCK = 64
+# Multiply-adds (rows * inner * columns) above which NumPy beats pure Python.
+NUMPY_THRESHOLD = 20**3
+_INT64_MAX = 2**63 - 1
+
+
+def shape(matrix):
+    """(rows, columns) of a matrix, raising ValueError if it is ragged or empty."""
+    if np is not None and isinstance(matrix, np.ndarray):
+        if matrix.ndim != 2:
+            raise ValueError(f"Matrix must be 2-dimensional, got {matrix.ndim} dimensions.")
+        return matrix.shape
+    if not matrix or not matrix[0]:
+        raise ValueError("Matrix must have at least one row and one column.")
+    columns = len(matrix[0])
+    for i, row in enumerate(matrix):
+        if len(row) != columns:
+            raise ValueError(f"Row {i} has {len(row)} columns, expected {columns}.")
+    return len(matrix), columns
+
+
+def zeros(rows, columns):
+    return [[0] * columns for _ in range(rows)]
+
+
+def add(a, b):
+    if shape(a) != shape(b):
+        raise ValueError(f"Cannot add a {shape(a)} matrix and a {shape(b)} matrix.")
+    if np is not None and isinstance(a, np.ndarray):
+        return a + b
+    return [[x + y for x, y in zip(row_a, row_b)] for row_a, row_b in zip(a, b)]
+
+
+def _multiply_python(a, b, rows, inner, columns):
+    result = zeros(rows, columns)
+    b_columns = [list(column) for column in zip(*b)]
+    for j0 in range(0, columns, BLOCK):
+        tile = b_columns[j0:j0 + BLOCK]
+        for i in range(rows):
+            row = a[i]
+            result[i][j0:j0 + BLOCK] = [sum(map(mul, row, column)) for column in tile]
+    return result
+
+
+def _fits_int64(a, b, inner):
+    """Whether every integer product sum is guaranteed to fit in int64."""
+    values_a = [x for row in a for x in row]
+    values_b = [x for row in b for x in row]
+    if not all(isinstance(x, int) for x in values_a + values_b):
+        return True  # floats (or mixed) are computed in float64 either way
+    largest_a = max(abs(x) for x in values_a)
+    largest_b = max(abs(x) for x in values_b)
+    return largest_a * largest_b * inner <= _INT64_MAX
+
+
+def multiply(a, b, backend="auto"):
+    """Matrix product a @ b; backend is "auto", "numpy" or "python"."""
+    rows, inner = shape(a)
+    inner_b, columns = shape(b)
+    if inner != inner_b:
+        raise ValueError(f"Cannot multiply a {rows}x{inner} matrix by a {inner_b}x{columns} matrix.")
+    if backend not in ("auto", "numpy", "python"):
+        raise ValueError(f"Unknown backend {backend!r}.")
+    arrays = np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray))
+    if backend == "auto":
+        large = rows * inner * columns > NUMPY_THRESHOLD
+        backend = "numpy" if np is not None and (arrays or (large and _fits_int64(a, b, inner))) else "python"
+    if backend == "numpy":
+        if np is None:
+            raise ValueError("The numpy backend needs NumPy installed.")
+        product = np.asarray(a) @ np.asarray(b)
+        return product if arrays else product.tolist()
+    if arrays:
+        a, b = np.asarray(a).tolist(), np.asarray(b).tolist()
+    return _multiply_python(a, b, rows, inner, columns)
+
+
+def transpose(matrix, in_place=False):
+    """Transpose of a matrix; in_place=True swaps a square matrix's entries in place."""
+    rows, columns = shape(matrix)
+    is_array = np is not None and isinstance(matrix, np.ndarray)
+    if not in_place:
+        return matrix.T.copy() if is_array else [list(column) for column in zip(*matrix)]
+    if rows != columns:
+        raise ValueError(f"Only square matrices can be transposed in place, got {rows}x{columns}.")
+    if is_array:
+        # Swap mirrored tiles, so the extra memory is one tile, not a whole copy.
+        for i0 in range(0, rows, BLOCK):
+            i1 = min(i0 + BLOCK, rows)
+            matrix[i0:i1, i0:i1] = matrix[i0:i1, i0:i1].T.copy()
+            for j0 in range(i1, rows, BLOCK):
+                j1 = min(j0 + BLOCK, rows)
+                upper = matrix[i0:i1, j0:j1].copy()
+                matrix[i0:i1, j0:j1] = matrix[j0:j1, i0:i1].T
+                matrix[j0:j1, i0:i1] = upper.T
+        return matrix
+    for i in range(rows):
+        row = matrix[i]
+        for j in range(i + 1, rows):
+            row[j], matrix[j][i] = matrix[j][i], row[j]
+    return matrix
@@ -0,0 +1,146 @@
+"""Prime numbers: segmented Sieve of Eratosthenes and Miller-Rabin.
+
+primes_in_range() streams primes segment by segment, so memory stays
+bounded by the segment size however large the range is. Each segment
+only stores odd numbers, one byte per candidate, so whole runs of
+multiples are crossed off with a single slice assignment.
+is_prime() is a deterministic Miller-Rabin test for any n below 2**64
+(and a strong probable-prime test above that).
+
+parallel_primes_in_range() sieves segments in a process pool that shares
+one copy of the base primes per worker and yields results in order.
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from math import isqrt
+
+# 2**20 numbers per segment: 512 KiB of odd-only flags.
+SEGMENT_SIZE = 1 << 20
+
+# These bases make Miller-Rabin exact for every n < 3.18 * 10**23, so for all 64-bit n.
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+_SMALL_PRIMES = _MR_BASES
+
+
+def is_prime(n):
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def base_primes(limit):
+    """All primes <= limit with a plain sieve (used to sieve segments)."""
+    if limit < 2:
+        return []
+    flags = bytearray([1]) * (limit + 1)
+    flags[0] = flags[1] = 0
+    for p in range(2, isqrt(limit) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return list(compress(range(limit + 1), flags))
+
+
+def sieve_segment(low, high, base):
+    """Primes in [low, high), given every prime up to sqrt(high) in base."""
+    found = [2] if low <= 2 < high else []
+    start = max(3, low | 1)
+    if start >= high:
+        return found
+    count = (high - start + 1) // 2
+    flags = bytearray([1]) * count
+    for p in base:
+        if p == 2:
+            continue
+        if p * p >= high:
+            break
+        multiple = max(p * p, (start + p - 1) // p * p)
+        if multiple % 2 == 0:
+            multiple += p
+        index = (multiple - start) // 2
+        if index < count:
+            flags[index::p] = bytes(len(range(index, count, p)))
+    found.extend(compress(range(start, high, 2), flags))
+    return found
+
+
+def primes_in_range(lower, upper, segment_size=SEGMENT_SIZE):
+    """Yield every prime p with lower <= p <= upper, in increasing order."""
+    lower = max(lower, 2)
+    if upper < lower:
+        return
+    base = base_primes(isqrt(upper))
+    for low in range(lower, upper + 1, segment_size):
+        high = min(low + segment_size, upper + 1)
+        yield from sieve_segment(low, high, base)
+
+
+def primes_up_to(n, segment_size=SEGMENT_SIZE):
+    return primes_in_range(2, n, segment_size)
+
+
+_worker_base = []
+
+
+def _init_worker(base):
+    global _worker_base
+    _worker_base = base
+
+
+def _sieve_worker(low, high, count_only):
+    primes = sieve_segment(low, high, _worker_base)
+    if count_only:
+        return len(primes)
+    # An unsigned 64-bit array pickles as one flat buffer, far cheaper than a list of ints.
+    return array("Q", primes)
+
+
+def _parallel_segments(lower, upper, workers, segment_size, count_only):
+    lower = max(lower, 2)
+    if upper < lower:
+        return
+    workers = workers or os.cpu_count() or 1
+    base = base_primes(isqrt(upper))
+    bounds = ((low, min(low + segment_size, upper + 1)) for low in range(lower, upper + 1, segment_size))
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(base,)) as pool:
+        # A window of pending segments keeps every worker busy while results
+        # are handed back strictly in range order.
+        pending = []
+        for low, high in bounds:
+            pending.append(pool.submit(_sieve_worker, low, high, count_only))
+            if len(pending) >= workers * 4:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+def parallel_primes_in_range(lower, upper, workers=None, segment_size=SEGMENT_SIZE):
+    """Like primes_in_range, but segments are sieved across a process pool."""
+    for segment in _parallel_segments(lower, upper, workers, segment_size, count_only=False):
+        yield from segment
+
+
+def count_primes_in_range(lower, upper, workers=None, segment_size=SEGMENT_SIZE):
+    """Number of primes in [lower, upper]; workers=1 counts serially in-process."""
+    if workers == 1:
+        return sum(1 for _ in primes_in_range(lower, upper, segment_size))
+    return sum(_parallel_segments(lower, upper, workers, segment_size, count_only=True))
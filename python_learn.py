@@ -1,5 +1,18 @@
+import atexit
+import copy
 import os
 import json
+import threading
+import time
+
+from answer_matching import compile_quiz
+from leaderboard import ACCURACY_BUCKETS, LeaderboardService
+from lesson_progress import LessonIndex
+from lesson_search import LessonSearch
+from lesson_store import LessonStore
+from quiz_analytics import AttemptLog
+from review_scheduler import ReviewQueue, backfill_reviews, new_review, quiz_quality, sm2_update
+from user_shards import ShardedUserStore
 
 progress_file = "users.json"
 
@@ -7,25 +20,250 @@ progress_file = "users.json"
 class UserManager:
     __users = {}
     progress_file = "users.json"
+    # Changed records are appended to progress_file + ".log" and folded back
+    # into progress_file once the log holds at least as many records as there
+    # are users (and no fewer than compact_min), so each full rewrite is paid
+    # for by as many cheap appends and a save stays O(1) on average.
+    compact_min = 1000
+    __log_entries = 0
+    # Write-behind: changed users are queued here and flushed together by a
+    # background thread every flush_interval seconds or once flush_threshold
+    # users are waiting, whichever comes first.
+    flush_interval = 5.0
+    flush_threshold = 100
+    __dirty = set()
+    # Users taken off the queue by flush() whose records are not on disk yet.
+    __flushing = set()
+    # Bumped on every change to a user's progress; load_users starts a new
+    # generation so versions from before a reload never match again.
+    __progress_versions = {}
+    __generation = 0
+    __lock = threading.RLock()
+    # Held from serializing records until they are on disk, and by
+    # compaction, so a batch can never land in the log after a snapshot
+    # that already superseded it.
+    __io_lock = threading.RLock()
+    __wake = threading.Event()
+    __stop = threading.Event()
+    __flusher = None
+    # Called as listener(username, lesson_id, due) whenever a review is (re)scheduled.
+    review_listeners = []
+    # Called as listener(username, record) whenever a user's record changes.
+    change_listeners = []
+    # Set by use_shards(); records then live in per-shard files instead of
+    # progress_file and its change log.
+    shard_store = None
+
+    @staticmethod
+    def use_shards(directory="users.d", count=16):
+        UserManager.shard_store = ShardedUserStore(directory, count)
+
+    @staticmethod
+    def log_file():
+        return UserManager.progress_file + ".log"
+
+    @staticmethod
+    def progress_version(username):
+        return UserManager.__generation, UserManager.__progress_versions.get(username, 0)
+
+    @staticmethod
+    def _progress_changed(username):
+        versions = UserManager.__progress_versions
+        versions[username] = versions.get(username, 0) + 1
 
-    
     @staticmethod
     def load_users():
+        UserManager.__generation += 1
+        UserManager.__progress_versions = {}
         try:
-            if os.path.exists(UserManager.progress_file):
+            if UserManager.shard_store is not None:
+                UserManager.__users = UserManager.shard_store.load_all()
+            elif os.path.exists(UserManager.progress_file):
                 with open(UserManager.progress_file, "r") as file:
                     UserManager.__users = json.load(file)
             else:
                 UserManager.__users = {}
+            if UserManager.shard_store is None:
+                UserManager.__log_entries = UserManager._replay_log()
         except (IOError, json.JSONDecodeError) as e:
             print(f"Error loading user data: {e}")
             UserManager.__users = {}
+        # Lessons completed before reviews were scheduled get one now, saved once.
+        backfilled = [name for name, record in UserManager.__users.items() if backfill_reviews(record)]
+        if backfilled:
+            UserManager._append_records(backfilled)
+        return UserManager.__users
+
+    @staticmethod
+    def refresh_user(username):
+        """Re-read one user from its shard, picking up other processes' changes.
+
+        A user whose own changes are still queued or being flushed is left
+        alone: the shard copy is older than memory and would overwrite them.
+        """
+        if UserManager.shard_store is None:
+            return
+        # Held across the read so no change can be queued and flushed meanwhile.
+        with UserManager.__lock:
+            if username in UserManager.__dirty or username in UserManager.__flushing:
+                return
+            record = UserManager.shard_store.load_user(username)
+            if record is not None:
+                backfill_reviews(record)
+                UserManager.__users[username] = record
+                UserManager._progress_changed(username)
+
+    @staticmethod
+    def _replay_log():
+        """Apply logged records on top of the snapshot and drop a torn last line."""
+        if not os.path.exists(UserManager.log_file()):
+            return 0
+        entries = 0
+        good_end = 0
+        with open(UserManager.log_file(), "rb+") as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                UserManager.__users[record["user"]] = record["data"]
+                good_end += len(line)
+                entries += 1
+            file.truncate(good_end)
+        return entries
+
+    @staticmethod
+    def save_user(username):
+        """Append the current record of one user to the change log."""
+        UserManager._append_records([username])
+
+    @staticmethod
+    def _append_records(usernames):
+        if UserManager.shard_store is not None:
+            # Snapshot and save under one io lock so an older snapshot can't
+            # overwrite a newer one on disk.
+            with UserManager.__io_lock:
+                with UserManager.__lock:
+                    records = {
+                        name: copy.deepcopy(UserManager.__users[name])
+                        for name in usernames
+                        if name in UserManager.__users
+                    }
+                try:
+                    UserManager.shard_store.save(records)
+                except IOError as e:
+                    print(f"Error saving user data: {e}")
+            return
+
+        # One write and one fsync for the whole batch of changed users.
+        with UserManager.__io_lock:
+            with UserManager.__lock:
+                lines = "".join(
+                    json.dumps({"user": name, "data": UserManager.__users[name]}) + "\n"
+                    for name in usernames
+                    if name in UserManager.__users
+                )
+            if not lines:
+                return
+            try:
+                with open(UserManager.log_file(), "a") as file:
+                    file.write(lines)
+                    file.flush()
+                    os.fsync(file.fileno())
+            except IOError as e:
+                print(f"Error saving user data: {e}")
+                return
+            UserManager.__log_entries += len(usernames)
+            if UserManager.__log_entries >= max(UserManager.compact_min, len(UserManager.__users)):
+                UserManager.save_users()
+
+    @staticmethod
+    def mark_dirty(username):
+        """Persist a changed user now, or queue it if write-behind is running."""
+        UserManager._notify_change(username)
+        if UserManager.__flusher is None:
+            UserManager.save_user(username)
+            return
+        with UserManager.__lock:
+            UserManager.__dirty.add(username)
+            pending = len(UserManager.__dirty)
+        if pending >= UserManager.flush_threshold:
+            UserManager.__wake.set()
+
+    @staticmethod
+    def _notify_change(username):
+        record = UserManager.__users.get(username)
+        if record is not None:
+            for listener in UserManager.change_listeners:
+                listener(username, record)
+
+    @staticmethod
+    def flush():
+        """Write every queued user to the change log."""
+        with UserManager.__lock:
+            dirty = UserManager.__dirty
+            UserManager.__dirty = set()
+            UserManager.__flushing |= dirty
+        if dirty:
+            try:
+                UserManager._append_records(sorted(dirty))
+            finally:
+                with UserManager.__lock:
+                    UserManager.__flushing -= dirty
+
+    @staticmethod
+    def start_write_behind(interval=None, threshold=None):
+        if UserManager.__flusher is not None:
+            return
+        if interval is not None:
+            UserManager.flush_interval = interval
+        if threshold is not None:
+            UserManager.flush_threshold = threshold
+        UserManager.__stop.clear()
+        UserManager.__flusher = threading.Thread(target=UserManager._flush_loop, daemon=True)
+        UserManager.__flusher.start()
+        atexit.register(UserManager.stop_write_behind)
+
+    @staticmethod
+    def stop_write_behind():
+        """Stop the background flusher and write whatever is still queued."""
+        flusher = UserManager.__flusher
+        if flusher is not None:
+            UserManager.__stop.set()
+            UserManager.__wake.set()
+            flusher.join()
+            UserManager.__flusher = None
+        UserManager.flush()
+
+    @staticmethod
+    def _flush_loop():
+        while not UserManager.__stop.is_set():
+            UserManager.__wake.wait(UserManager.flush_interval)
+            UserManager.__wake.clear()
+            UserManager.flush()
 
     @staticmethod
     def save_users():
+        """Write a full snapshot atomically and empty the change log.
+
+        With shards there is no snapshot: only users changed by this process
+        are written, so other processes' newer records are never overwritten.
+        """
+        if UserManager.shard_store is not None:
+            UserManager.flush()
+            return
+        temp_file = UserManager.progress_file + ".tmp"
         try:
-            with open(UserManager.progress_file, "w") as file:
-                json.dump(UserManager.__users, file)
+            with UserManager.__io_lock, UserManager.__lock:
+                with open(temp_file, "w") as file:
+                    json.dump(UserManager.__users, file)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temp_file, UserManager.progress_file)
+                open(UserManager.log_file(), "w").close()
+                UserManager.__log_entries = 0
         except IOError as e:
             print(f"Error saving user data: {e}")
 
@@ -34,14 +272,98 @@ class UserManager:
         if username in UserManager.__users:
             print("User already exists.")
             return False
-        UserManager.__users[username] = {
-            "password": password,  # Store password in a private variable
-            "progress": {},
-            "statistics": {"completed_lessons": 0, "quiz_accuracy": 0},
-        }
-        UserManager.save_users()
+        with UserManager.__lock:
+            UserManager.__users[username] = {
+                "password": password,  # Store password in a private variable
+                "progress": {},
+                "statistics": {"completed_lessons": 0, "quiz_accuracy": 0},
+            }
+            UserManager._progress_changed(username)
+        UserManager.mark_dirty(username)
         return True
-        
+
+    @staticmethod
+    def reset_password(username, new_password):
+        with UserManager.__lock:
+            UserManager.__users[username]["password"] = new_password
+        UserManager.mark_dirty(username)
+
+    @staticmethod
+    def _complete(username, lesson_id):
+        """Mark lesson_id complete for a user and return its review; call with the lock held."""
+        user = UserManager.__users[username]
+        UserManager._progress_changed(username)
+        user["progress"][lesson_id] = True
+        user["statistics"]["completed_lessons"] = len(user["progress"])
+        return user.setdefault("reviews", {}).setdefault(lesson_id, new_review())
+
+    @staticmethod
+    def complete_lesson(username, lesson_id):
+        with UserManager.__lock:
+            review = UserManager._complete(username, lesson_id)
+        UserManager.mark_dirty(username)
+        UserManager._notify_review(username, lesson_id, review["due"])
+
+    @staticmethod
+    def record_review(username, lesson_id, quality):
+        """Apply an SM-2 review of a completed lesson and return its next due time."""
+        with UserManager.__lock:
+            reviews = UserManager.__users[username].setdefault("reviews", {})
+            review = sm2_update(reviews.setdefault(lesson_id, new_review()), quality)
+        UserManager.mark_dirty(username)
+        UserManager._notify_review(username, lesson_id, review["due"])
+        return review["due"]
+
+    @staticmethod
+    def _add_quiz_score(stats, correct, total):
+        stats["quiz_correct"] = stats.get("quiz_correct", 0) + correct
+        stats["quiz_answered"] = stats.get("quiz_answered", 0) + total
+        if stats["quiz_answered"]:
+            stats["quiz_accuracy"] = round(100 * stats["quiz_correct"] / stats["quiz_answered"], 1)
+
+    @staticmethod
+    def record_quiz_result(username, correct, total, lesson_id=None):
+        """Add one graded quiz to a user's accuracy, completing lesson_id if it is given."""
+        review = None
+        with UserManager.__lock:
+            if lesson_id is not None:
+                review = UserManager._complete(username, lesson_id)
+            UserManager._add_quiz_score(UserManager.__users[username]["statistics"], correct, total)
+        UserManager.mark_dirty(username)
+        if review is not None:
+            UserManager._notify_review(username, lesson_id, review["due"])
+
+    @staticmethod
+    def _notify_review(username, lesson_id, due):
+        for listener in UserManager.review_listeners:
+            listener(username, lesson_id, due)
+
+    @staticmethod
+    def record_quiz_results(results):
+        """Apply graded quiz totals for many users and save them in one batch.
+
+        results maps username -> {"correct": int, "total": int, "completed": lesson ids}.
+        Unknown users are skipped. Returns the number of users updated.
+        """
+        updated = []
+        scheduled = []
+        with UserManager.__lock:
+            for username, result in results.items():
+                user = UserManager.__users.get(username)
+                if user is None:
+                    continue
+                for lesson_id in result["completed"]:
+                    review = UserManager._complete(username, lesson_id)
+                    scheduled.append((username, lesson_id, review["due"]))
+                UserManager._add_quiz_score(user["statistics"], result["correct"], result["total"])
+                updated.append(username)
+        for username in updated:
+            UserManager._notify_change(username)
+        for username, lesson_id, due in scheduled:
+            UserManager._notify_review(username, lesson_id, due)
+        UserManager._append_records(updated)
+        return len(updated)
+
     @staticmethod
     def authenticate_user(username, password):
         if username not in UserManager.__users:
@@ -64,16 +386,22 @@ class Quiz(Lesson):
     def __init__(self, title, content, questions):
         super().__init__(title, content)
         self.questions = questions
+        self.answer_keys = compile_quiz(questions)
 
-    def take_quiz(self):
+    def take_quiz(self, attempt_log=None, username="", lesson_id=None):
         correct = 0
-        for question, answer in self.questions:
-            user_answer = input(f"{question} (Hint: {answer[0]}) ").strip().lower()
-            if user_answer == answer.lower():
+        results = []
+        for (question, answer), key in zip(self.questions, self.answer_keys):
+            user_answer = input(f"{question} (Hint: {answer[0]}) ")
+            is_correct = key.matches(user_answer)
+            results.append((user_answer, is_correct))
+            if is_correct:
                 correct += 1
                 print("Correct!")
             else:
                 print(f"Incorrect. The correct answer is '{answer}'.")
+        if attempt_log is not None:
+            attempt_log.record_attempt(username, lesson_id or self.title, results)
         return f"Quiz completed! You got {correct}/{len(self.questions)} correct."
 
 class LessonProgress:
@@ -92,245 +420,17 @@ class AdvancedQuiz(Quiz, LessonProgress):
         LessonProgress.__init__(self)
         self.lesson_id = lesson_id
 
-    def complete_lesson_and_take_quiz(self):
+    def complete_lesson_and_take_quiz(self, attempt_log=None, username=""):
         print(self.display())
-        print(self.take_quiz())
+        print(self.take_quiz(attempt_log, username, self.lesson_id))
         print(self.mark_complete(self.lesson_id))
 
 
-# Lessons grouped by categories
-lessons = {
-    "Python Basics": {
-        "1": {
-            "name": "Python Syntax",
-            "content": "Python syntax defines how Python programs are structured. Python uses indentation to define blocks of code instead of braces or keywords. Statements end with a newline, and the language is case-sensitive.",
-            "quiz": [
-                ("What function prints text?", "print"),
-                ("What is used to define a block of code?", "indentation"),
-                ("Is Python case-sensitive?", "yes"),
-                ("What keyword starts a function definition?", "def"),
-                ("Which character ends statements in Python?", "newline"),
-            ],
-        },
-        "2": {
-            "name": "Variables",
-            "content": "Variables in Python store data values. They are created by assigning values using the '=' operator. Variable names must start with a letter or underscore and cannot contain spaces.",
-            "quiz": [
-                ("What operator assigns values?", "="),
-                ("Can variable names start with numbers?", "no"),
-                ("What symbol is used to assign values in Python?", "="),
-                ("Are variable names case-sensitive?", "yes"),
-                ("Can you use spaces in variable names?", "no"),
-            ],
-        },
-        "3": {
-            "name": "Data Types",
-            "content": "Python supports data types like integers, floats, strings, booleans, and more. Data types determine the kind of data stored and the operations that can be performed.",
-            "quiz": [
-                ("What type represents text?", "str"),
-                ("What type stores numbers with decimal points?", "float"),
-                ("Can a list hold multiple data types?", "yes"),
-                ("What type represents True or False?", "boolean"),
-                ("What data type represents integers?", "int"),
-            ],
-        },
-        "4": {
-            "name": "Comments",
-            "content": "Comments in Python are used to explain code. They are ignored during execution. Use `#` for single-line comments and triple quotes for multi-line comments.",
-            "quiz": [
-                ("What symbol starts a comment?", "#"),
-                ("Are comments executed by Python?", "no"),
-                ("What is the syntax for multi-line comments?", "triple quotes"),
-                ("Can you write a comment in the middle of a statement?", "no"),
-                ("What are comments mainly used for?", "explaining code"),
-            ],
-        },
-        "5": {
-            "name": "Numbers",
-            "content": "Python supports various types of numbers like integers (int), floating-point numbers (float), and complex numbers. Mathematical operations are supported using operators like +, -, *, and /.",
-            "quiz": [
-                ("Which type stores decimal numbers?", "float"),
-                ("What operator adds numbers?", "+"),
-                ("Are integers mutable in Python?", "no"),
-                ("Which type is used for complex numbers?", "complex"),
-                ("Can a float store whole numbers?", "yes"),
-            ],
-        },
-    },
-    "Data Types and Structures": {
-        "6": {
-            "name": "Strings",
-            "content": "Strings are sequences of characters enclosed in quotes. They support operations like concatenation (+), slicing, and methods like upper(), lower(), and split().",
-            "quiz": [
-                ("What type represents text?", "string"),
-                ("How do you concatenate strings?", "+"),
-                ("Can strings be sliced?", "yes"),
-                ("What method converts a string to uppercase?", "upper"),
-                ("Can strings be modified in-place?", "no"),
-            ],
-        },
-        "7": {
-            "name": "Booleans",
-            "content": "Booleans have two values: True and False. They are used in logical operations and control structures. Boolean operations include and, or, and not.",
-            "quiz": [
-                ("What are the two Boolean values?", "True and False"),
-                ("What operator returns True if both operands are True?", "and"),
-                ("What operator negates a Boolean value?", "not"),
-                ("Are booleans a subtype of integers in Python?", "yes"),
-                ("What is the Boolean value of an empty string?", "False"),
-            ],
-        },
-        "8": {
-            "name": "Lists",
-            "content": "Lists are ordered collections of items, which can be of any type. Lists are mutable, meaning they can be changed after creation using methods like append(), remove(), and sort().",
-            "quiz": [
-                ("Are lists mutable?", "yes"),
-                ("What method adds an item to a list?", "append"),
-                ("Can a list store duplicate values?", "yes"),
-                ("How do you access the first element of a list?", "index 0"),
-                ("What method removes an item from a list?", "remove"),
-            ],
-        },
-        "9": {
-            "name": "Tuples",
-            "content": "Tuples are immutable collections of items, which means their values cannot be changed after creation. Tuples are defined using parentheses ().",
-            "quiz": [
-                ("Are tuples immutable?", "yes"),
-                ("Can a tuple contain duplicate values?", "yes"),
-                ("How are tuples defined?", "parentheses"),
-                ("Can you add items to a tuple after it is created?", "no"),
-                ("What function converts a list to a tuple?", "tuple"),
-            ],
-        },
-        "10": {
-            "name": "Sets",
-            "content": "Sets store unique, unordered items. They do not allow duplicate values. Common operations include union, intersection, and difference.",
-            "quiz": [
-                ("Do sets allow duplicates?", "no"),
-                ("What function creates a set?", "set"),
-                ("Are sets mutable?", "yes"),
-                ("How do you add an element to a set?", "add"),
-                ("Can you index items in a set?", "no"),
-            ],
-        },
-        "11": {
-            "name": "Dictionaries",
-            "content": "Dictionaries store key-value pairs. Keys must be unique and immutable. Common methods include keys(), values(), and items().",
-            "quiz": [
-                ("What data type uses key-value pairs?", "dictionary"),
-                ("Can dictionary keys be mutable?", "no"),
-                ("How do you access a value in a dictionary?", "key"),
-                ("What method returns all the keys in a dictionary?", "keys"),
-                ("Can dictionaries be nested?", "yes"),
-            ],
-        },
-    },
-        "Operators and Control Flow": {
-        "12": {
-            "name": "Operators",
-            "content": "Operators in Python are used to perform operations on variables and values. Categories include arithmetic (+, -, *, /), comparison (==, !=, >, <), logical (and, or, not), and assignment (+=, -=).",
-            "quiz": [
-                ("What operator adds values?", "+"),
-                ("What operator checks for equality?", "=="),
-                ("What operator combines conditions?", "and"),
-                ("What operator assigns a value?", "="),
-                ("What is the modulus operator?", "%"),
-            ],
-        },
-        "13": {
-            "name": "If-Else Statements",
-            "content": "If-else statements execute code blocks based on conditions. The syntax includes 'if', 'elif' (optional), and 'else' (optional) blocks. Indentation defines the scope.",
-            "quiz": [
-                ("What keyword starts a condition?", "if"),
-                ("What keyword provides an alternative condition?", "elif"),
-                ("What keyword specifies the default action?", "else"),
-                ("Can 'elif' be used without 'if'?", "no"),
-                ("Do 'if' conditions require indentation?", "yes"),
-            ],
-        },
-        "14": {
-            "name": "Loops",
-            "content": "Loops in Python are used to repeat code. 'for' loops iterate over a sequence, while 'while' loops repeat based on a condition. Use 'break' to exit a loop and 'continue' to skip to the next iteration.",
-            "quiz": [
-                ("Which loop iterates over a sequence?", "for"),
-                ("Which loop continues while a condition is true?", "while"),
-                ("What statement exits a loop early?", "break"),
-                ("What statement skips the rest of the loop iteration?", "continue"),
-                ("Can you nest loops in Python?", "yes"),
-            ],
-        },
-    },
-    "Functions and Advanced Concepts": {
-        "15": {
-            "name": "Functions",
-            "content": "Functions encapsulate reusable blocks of code. They are defined using the 'def' keyword, followed by a name and parameters in parentheses. Functions can return values using the 'return' keyword.",
-            "quiz": [
-                ("What keyword defines a function?", "def"),
-                ("What keyword returns a value from a function?", "return"),
-                ("Can functions have default parameter values?", "yes"),
-                ("What symbol is used to call a function?", "parentheses"),
-                ("Can a function return multiple values?", "yes"),
-            ],
-        },
-        "16": {
-            "name": "Arrays",
-            "content": "Arrays store elements of the same type and are part of the 'array' module in Python. Arrays allow for fast numerical computations and support various operations like slicing and indexing.",
-            "quiz": [
-                ("Which module supports arrays?", "array"),
-                ("Can arrays store elements of different types?", "no"),
-                ("What method adds an element to an array?", "append"),
-                ("Can you slice an array in Python?", "yes"),
-                ("Are arrays mutable?", "yes"),
-            ],
-        },
-        "17": {
-            "name": "Inheritance",
-            "content": "Inheritance allows a class to derive from another class, enabling reuse of code and functionality. A derived class inherits attributes and methods from the base class.",
-            "quiz": [
-                ("What is the base class in inheritance called?", "parent"),
-                ("Can a derived class override parent methods?", "yes"),
-                ("What keyword is used to inherit from a class?", "class"),
-                ("Can Python classes inherit from multiple classes?", "yes"),
-                ("Does inheritance support method overriding?", "yes"),
-            ],
-        },
-        "18": {
-            "name": "Polymorphism",
-            "content": "Polymorphism allows methods to behave differently based on the object calling them. This enables method overriding in subclasses, providing flexibility in object-oriented programming.",
-            "quiz": [
-                ("Does polymorphism allow method overriding?", "yes"),
-                ("What principle allows a subclass to override a method?", "polymorphism"),
-                ("Is polymorphism only used with methods?", "no"),
-                ("Can Python functions accept different object types?", "yes"),
-                ("Does polymorphism promote code reuse?", "yes"),
-            ],
-        },
-        "19": {
-            "name": "Exception Handling",
-            "content": "Exceptions are errors that occur during execution. Python handles exceptions using 'try', 'except', and optionally 'finally'. This prevents crashes and allows graceful error handling.",
-            "quiz": [
-                ("What block catches exceptions?", "except"),
-                ("What block always executes?", "finally"),
-                ("Can you have multiple 'except' blocks?", "yes"),
-                ("What keyword is used to raise exceptions?", "raise"),
-                ("What exception is raised for division by zero?", "ZeroDivisionError"),
-            ],
-        },
-    },
-    "NumPy Basics": {
-        "20": {
-            "name": "NumPy Arrays",
-            "content": "NumPy provides powerful tools for array manipulation. Arrays are created using 'numpy.array'. They support advanced operations like broadcasting, slicing, and mathematical computations.",
-            "quiz": [
-                ("Which library is used for numerical computations?", "numpy"),
-                ("What function creates a NumPy array?", "array"),
-                ("Can NumPy arrays store multiple data types?", "no"),
-                ("What operation allows element-wise addition?", "broadcasting"),
-                ("Is NumPy faster than Python lists for numerical operations?", "yes"),
-            ],
-        },
-    },
-}
+# Lessons grouped by categories, stored in lessons.jsonl and loaded on demand.
+# `lessons` holds only category and lesson names; LessonHandler reads the
+# content and quiz of a lesson from the store the first time it is viewed.
+lesson_store = LessonStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), "lessons.jsonl"))
+lessons = lesson_store.catalog
 
 def display_menu(current_user):
     print("\n--- Python Learning Program ---")
@@ -340,6 +440,8 @@ def display_menu(current_user):
         print("2. View Progress")
         print("3. Log Out")
         print("4. Exit")
+        print("5. Review Due Lessons")
+        print("6. View Leaderboard")
     else:
         print("1. Log in / Sign up")
         print("2. Exit")
@@ -354,6 +456,7 @@ def log_in(users):
     try:
         print("\n--- Log In / Sign Up ---")
         username = input("Enter your username: ")
+        UserManager.refresh_user(username)
         
         if username in UserManager._UserManager__users:
             print("Welcome back, returning user!")
@@ -364,8 +467,7 @@ def log_in(users):
                 new_password = input("Enter your new password: ")
                 confirm_password = input("Confirm your new password: ")
                 if new_password == confirm_password:
-                    UserManager.__users[username]["password"] = new_password
-                    UserManager.save_users(users)  # Corrected reference
+                    UserManager.reset_password(username, new_password)
                     print("Password reset successfully!")
                     return username
                 else:
@@ -384,12 +486,6 @@ def log_in(users):
             confirm_password = input("Confirm your password: ")
             if new_password == confirm_password:
                 UserManager.add_user(username, new_password)
-                users[username] = {
-                    "password": new_password,
-                    "progress": {},
-                    "statistics": {"completed_lessons": 0, "quiz_accuracy": 0}
-                }
-                # UserManager.save_users(users)  # Corrected reference
                 print("Account created successfully!")
                 return username
             else:
@@ -399,24 +495,113 @@ def log_in(users):
         print(f"An error occurred during login/signup: {e}")
         return None
 
-class LessonHandler:
-    """Class to manage lessons and quizzes."""
-    def __init__(self, lessons):
+class MenuRenderer:
+    """Caches rendered menus per (user, category).
+
+    Each cached block remembers the UserManager.progress_version it was
+    rendered for. lesson_completed() re-renders just the one changed line
+    and moves the user's other blocks to the new version; a block whose
+    version is stale for any other reason is rebuilt in full. Menus for a
+    user who is not logged in are rendered without caching.
+    """
+    def __init__(self, lessons, version_of=None, lesson_index=None):
         self.lessons = lessons
+        self.version_of = version_of or UserManager.progress_version
+        self.lesson_index = lesson_index or LessonIndex(lessons)
+        self.categories = list(lessons.keys())
+        self.category_menu = "\n".join(f"{i}. {category}" for i, category in enumerate(self.categories, start=1))
+        self.lesson_category = {
+            lesson_id: category for category, lessons_data in lessons.items() for lesson_id in lessons_data
+        }
+        self._blocks = {"menu": {}, "progress": {}}
+
+    @staticmethod
+    def _menu_line(lesson_id, lesson, done):
+        return f"{lesson_id}. {lesson['name']} {'✅' if done else '❌'}"
+
+    @staticmethod
+    def _progress_line(lesson_id, lesson, done):
+        return f"  {lesson['name']}: {'Completed' if done else 'Not Completed'}"
+
+    def _counts(self, progress):
+        return self.lesson_index.category_counts(self.lesson_index.encode(progress))
+
+    def _render(self, kind, username, category, progress, counts=None):
+        version = self.version_of(username) if username else None
+        blocks = self._blocks[kind].setdefault(username, {}) if username else {}
+        block = blocks.get(category)
+        if block is None or block["version"] != version:
+            render_line = self._menu_line if kind == "menu" else self._progress_line
+            lessons_data = self.lessons[category]
+            block = {
+                "version": version,
+                "lines": {
+                    lesson_id: render_line(lesson_id, lesson, lesson_id in progress)
+                    for lesson_id, lesson in lessons_data.items()
+                },
+                "done": (counts or self._counts(progress))[category],
+                "text": None,
+            }
+            blocks[category] = block
+        if block["text"] is None:
+            body = "\n".join(block["lines"].values())
+            if kind == "progress":
+                body = f"{category}: {block['done']}/{len(self.lessons[category])}\n{body}"
+            block["text"] = body
+        return block["text"]
+
+    def lesson_menu(self, username, category, progress):
+        return self._render("menu", username, category, progress)
+
+    def progress_view(self, username, progress):
+        counts = self._counts(progress)
+        return "\n".join(
+            self._render("progress", username, category, progress, counts) for category in self.categories
+        )
+
+    def lesson_completed(self, username, lesson_id, progress):
+        """Refresh only the lines showing lesson_id for this user."""
+        category = self.lesson_category.get(lesson_id)
+        if category is None or not username:
+            return
+        lesson = self.lessons[category][lesson_id]
+        generation, count = version = self.version_of(username)
+        for kind, render_line in (("menu", self._menu_line), ("progress", self._progress_line)):
+            for block_category, block in self._blocks[kind].get(username, {}).items():
+                if block["version"] != (generation, count - 1):
+                    continue  # missed other changes: rebuilt on next view
+                block["version"] = version
+                if block_category == category:
+                    block["lines"][lesson_id] = render_line(lesson_id, lesson, True)
+                    block["done"] += 1
+                    block["text"] = None
+
 
-    def view_categories(self, progress):
+class LessonHandler:
+    """Class to manage lessons and quizzes."""
+    def __init__(self, store, attempt_log=None, renderer=None):
+        self.store = store
+        self.attempt_log = attempt_log
+        self.search_index = None
+        self.lessons = store.catalog
+        self.answer_keys = {}
+        self.renderer = renderer or MenuRenderer(self.lessons)
+
+    def view_categories(self, progress, username=None):
         try:
             while True:
                 print("\n--- Categories ---")
-                categories = list(self.lessons.keys())
-                for i, category in enumerate(categories, start=1):
-                    print(f"{i}. {category}")
+                categories = self.renderer.categories
+                print(self.renderer.category_menu)
+                print("s. Search Lessons")
                 print("m. Main Menu")
-                choice = input("\nEnter the category number or 'm' to return to the main menu: ")
+                choice = input("\nEnter the category number, 's' to search or 'm' to return to the main menu: ")
 
                 if choice.isdigit() and 1 <= int(choice) <= len(categories):
                     category = categories[int(choice) - 1]
-                    self.view_lessons(category, progress)
+                    self.view_lessons(category, progress, username)
+                elif choice.lower() == 's':
+                    self.search_lessons(progress, username)
                 elif choice.lower() == 'm':
                     return
                 else:
@@ -424,18 +609,33 @@ class LessonHandler:
         except Exception as e:
             print(f"An error occurred: {e}")
 
-    def view_lessons(self, category, progress):
+    def search_lessons(self, progress, username=None):
+        if self.search_index is None:
+            self.search_index = LessonSearch(self.store)
+        query = input("\nSearch for: ")
+        results = self.search_index.search(query, limit=5)
+        if not results:
+            print("No lessons matched your search.")
+            return
+        print(f"\n--- Results for '{query}' ---")
+        for lesson_id, _ in results:
+            category = self.store.find_category(lesson_id)
+            status = "✅" if lesson_id in progress else "❌"
+            print(f"{lesson_id}. {self.lessons[category][lesson_id]['name']} ({category}) {status}")
+        choice = input("\nEnter the lesson number to view or press Enter to go back: ")
+        if choice in dict(results):
+            self.view_lesson(self.store.find_category(choice), choice, progress, username)
+
+    def view_lessons(self, category, progress, username=None):
         try:
             while True:
                 print(f"\n--- {category} Lessons ---")
-                for lesson_id, lesson in self.lessons[category].items():
-                    status = "✅" if lesson_id in progress else "❌"
-                    print(f"{lesson_id}. {lesson['name']} {status}")
+                print(self.renderer.lesson_menu(username, category, progress))
                 print("m. Main Menu")
 
                 choice = input("\nEnter the lesson number to view or 'm' to return to the main menu: ")
                 if choice in self.lessons[category]:
-                    self.view_lesson(category, choice, progress)
+                    self.view_lesson(category, choice, progress, username)
                 elif choice.lower() == "m":
                     return
                 else:
@@ -443,25 +643,43 @@ class LessonHandler:
         except Exception as e:
             print(f"An error occurred: {e}")
 
-    def view_lesson(self, category, lesson_id, progress):
+    def view_lesson(self, category, lesson_id, progress, username=None):
         try:
-            lesson = self.lessons[category][lesson_id]
+            lesson = self.store.load(lesson_id)
             print(f"\n--- {lesson['name']} ---")
             print(lesson["content"])
             input("\nPress Enter to take the quiz...")
 
+            if lesson_id not in self.answer_keys:
+                self.answer_keys[lesson_id] = compile_quiz(lesson["quiz"])
+
             correct = 0
-            for question, answer in lesson["quiz"]:
+            results = []
+            for (question, answer), key in zip(lesson["quiz"], self.answer_keys[lesson_id]):
                 user_answer = input(f"{question} (Hint: {answer[0]}) ")
-                if user_answer.lower() == answer.lower():
+                is_correct = key.matches(user_answer)
+                results.append((user_answer, is_correct))
+                if is_correct:
                     correct += 1
                     print("Correct!")
                 else:
                     print(f"Incorrect. The correct answer is '{answer}'.")
-            
-            print(f"\nQuiz completed! You got {correct}/{len(lesson['quiz'])} correct.")
-            if correct == len(lesson["quiz"]):
-                progress[lesson_id] = True
+            if self.attempt_log is not None:
+                self.attempt_log.record_attempt(username or "", lesson_id, results)
+
+            total = len(lesson["quiz"])
+            print(f"\nQuiz completed! You got {correct}/{total} correct.")
+            already_done = lesson_id in progress
+            completed = correct == total and not already_done
+            if username:
+                UserManager.record_quiz_result(username, correct, total, lesson_id if completed else None)
+            if username and already_done:
+                due = UserManager.record_review(username, lesson_id, quiz_quality(correct, total))
+                print(f"Review recorded. Next review: {time.strftime('%Y-%m-%d %H:%M', time.localtime(due))}")
+            elif completed:
+                if not username:
+                    progress[lesson_id] = True
+                self.renderer.lesson_completed(username, lesson_id, progress)
                 print("Lesson marked as complete!")
         except Exception as e:
             print(f"An error occurred while viewing the lesson: {e}")
@@ -475,10 +693,11 @@ def log_out():
 
 class UserProgress:
     """Class to manage user progress."""
-    def __init__(self, username, lessons):
+    def __init__(self, username, lessons, lesson_index=None, renderer=None):
         self.username = username
         # self.users = users
         self.lessons = lessons  # Added lessons as an instance variable
+        self.renderer = renderer or MenuRenderer(lessons, lesson_index=lesson_index)
 
     def view_progress(self):
         try:
@@ -488,19 +707,38 @@ class UserProgress:
                 return
             
             print(f"\n--- {self.username}'s Progress ---")
-            progress = user_data.get("progress", {})
-            for category, lessons_data in self.lessons.items():
-                print(f"{category}:")
-                for lesson_id, lesson in lessons_data.items():
-                    status = "Completed" if lesson_id in progress else "Not Completed"
-                    print(f"  {lesson['name']}: {status}")
+            print(self.renderer.progress_view(self.username, user_data.get("progress", {})))
         except Exception as e:
             print(f"An error occurred while viewing progress: {e}")
 
+def view_leaderboard(leaderboards, username, size=10):
+    print("\n--- Leaderboard ---")
+    for place, (name, score) in enumerate(leaderboards.top(size), start=1):
+        completed, accuracy = divmod(score, ACCURACY_BUCKETS)
+        print(f"{place}. {name}: {completed} lessons, {accuracy}% quiz accuracy")
+    print(f"Your rank: {leaderboards.rank(username)} of {len(leaderboards.global_board)}")
+    for category in leaderboards.category_boards:
+        print(f"  {category}: rank {leaderboards.rank(username, category)}")
+
+
 def main():
     users = UserManager.load_users()
+    UserManager.start_write_behind()
+    try:
+        run(users)
+    finally:
+        UserManager.stop_write_behind()
+
+
+def run(users):
     current_user = None
-    lesson_handler = LessonHandler(lessons)
+    lesson_index = LessonIndex(lessons)
+    renderer = MenuRenderer(lessons, lesson_index=lesson_index)
+    lesson_handler = LessonHandler(lesson_store, AttemptLog("quiz_attempts.bin", lessons), renderer)
+    review_queue = ReviewQueue(users)
+    UserManager.review_listeners.append(review_queue.push)
+    leaderboards = LeaderboardService(lessons, lesson_index).load(users)
+    UserManager.change_listeners.append(leaderboards.update_user)
 
     while True:
         try:
@@ -512,16 +750,26 @@ def main():
                     continue
                 if choice == "1":
                     progress = UserManager._UserManager__users[current_user].get("progress", {})
-                    lesson_handler.view_categories(progress)
+                    lesson_handler.view_categories(progress, current_user)
                 elif choice == "2":
                     progress = UserManager._UserManager__users[current_user].get("progress", {})
-                    UserProgress(current_user, lessons).view_progress()
+                    UserProgress(current_user, lessons, lesson_index, lesson_handler.renderer).view_progress()
                 elif choice == "3":
                     current_user = log_out()
                 elif choice == "4":
                     print("Saving progress and exiting. Goodbye!")
-                    UserManager.save_users(users)
+                    UserManager.flush()
                     break
+                elif choice == "5":
+                    lesson_id = review_queue.next_due(current_user)
+                    if lesson_id is None:
+                        print("No lessons are due for review right now.")
+                    else:
+                        progress = UserManager._UserManager__users[current_user].get("progress", {})
+                        category = lesson_store.find_category(lesson_id)
+                        lesson_handler.view_lesson(category, lesson_id, progress, current_user)
+                elif choice == "6":
+                    view_leaderboard(leaderboards, current_user)
                 else:
                     print("Invalid choice! Please try again.")
             else:
@@ -0,0 +1,142 @@
+"""Quadratic equation solver for single equations and large coefficient batches.
+
+Roots come from the numerically stable form
+    q = -(b + sign(b) * sqrt(b**2 - 4ac)) / 2,   x1 = q / a,   x2 = c / q
+so b and the square root are never subtracted from each other. The
+textbook formula loses most of the small root's digits when b**2 >> 4ac.
+When a == 0 the equation is linear: x1 = -c / b and x2 is NaN. When a and
+b are both 0, both roots are NaN.
+
+solve() works elementwise on NumPy arrays. solve_file() streams a CSV or
+.npy file of a, b, c rows through solve() chunk by chunk and writes each
+chunk of results before reading the next:
+
+    python quadratic.py coefficients.npy roots.npy --chunk-size 1000000
+"""
+import argparse
+import cmath
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # solve_one still works; batch solving needs NumPy
+    np = None
+
+CHUNK_SIZE = 1 << 20
+RESULT_COLUMNS = ("discriminant", "root1_real", "root1_imag", "root2_real", "root2_imag")
+
+
+def solve_one(a, b, c):
+    """Both roots of ax^2 + bx + c = 0 as complex numbers (NaN where undefined)."""
+    nan = complex("nan")
+    if a == 0:
+        return (complex(-c / b), nan) if b != 0 else (nan, nan)
+    root = cmath.sqrt(b * b - 4 * a * c)
+    q = -(b + root) / 2 if b >= 0 else -(b - root) / 2
+    if q == 0:
+        return 0j, 0j
+    return q / a, c / q
+
+
+def solve(a, b, c):
+    """Vectorized roots for arrays of coefficients.
+
+    Returns (discriminant, root1, root2), where the roots are complex128
+    arrays. A root is real exactly where discriminant >= 0.
+    """
+    a, b, c = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (a, b, c)))
+    discriminant = b * b - 4 * a * c
+    root = np.sqrt(discriminant.astype(np.complex128))
+    # copysign keeps b and the root on the same side; b == 0 takes the + branch.
+    q = -0.5 * (b + np.copysign(1.0, b) * root)
+    linear = a == 0
+    degenerate = q == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root1 = np.where(linear, -c / b, q / a)
+        root2 = np.where(degenerate, 0, c / q)
+    root1 = np.where(linear & (b == 0), np.nan, root1).astype(np.complex128)
+    root2 = np.where(linear, np.nan, root2).astype(np.complex128)
+    return discriminant, root1, root2
+
+
+def _result_rows(discriminant, root1, root2):
+    return np.column_stack((discriminant, root1.real, root1.imag, root2.real, root2.imag))
+
+
+def _csv_chunks(path, chunk_size):
+    with open(path, "r") as file:
+        lines = (line for line in file if line.strip())
+        first = next(lines, None)
+        if first is None:
+            return
+        try:
+            [float(value) for value in first.split(",")]
+            lines = _prepend(first, lines)
+        except ValueError:
+            pass  # the first line is a column header
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                return
+            coefficients = np.loadtxt(chunk, delimiter=",", ndmin=2)
+            if coefficients.size:
+                yield coefficients
+
+
+def _prepend(first, lines):
+    yield first
+    yield from lines
+
+
+def _npy_chunks(path, chunk_size):
+    coefficients = np.load(path, mmap_mode="r")
+    if coefficients.ndim != 2 or coefficients.shape[1] != 3:
+        raise ValueError(f"{path} must hold an (N, 3) array of a, b, c rows.")
+    for start in range(0, len(coefficients), chunk_size):
+        yield np.asarray(coefficients[start:start + chunk_size], dtype=np.float64)
+
+
+def solve_file(input_path, output_path, chunk_size=CHUNK_SIZE):
+    """Solve every a, b, c row of a .csv or .npy file and return the row count.
+
+    The output format follows output_path's extension. A .npy output is an
+    (N, 5) float64 array written through a memory map. It needs a .npy
+    input so N is known up front. Any other output is CSV with a header of
+    RESULT_COLUMNS.
+    """
+    from_npy = input_path.endswith(".npy")
+    chunks = _npy_chunks(input_path, chunk_size) if from_npy else _csv_chunks(input_path, chunk_size)
+    written = 0
+    if output_path.endswith(".npy"):
+        if not from_npy:
+            raise ValueError("A .npy output needs a .npy input; write CSV instead.")
+        total = len(np.load(input_path, mmap_mode="r"))
+        output = np.lib.format.open_memmap(output_path, mode="w+", dtype=np.float64, shape=(total, len(RESULT_COLUMNS)))
+        for chunk in chunks:
+            rows = _result_rows(*solve(chunk[:, 0], chunk[:, 1], chunk[:, 2]))
+            output[written:written + len(rows)] = rows
+            written += len(rows)
+        output.flush()
+        del output
+        return written
+    with open(output_path, "w") as file:
+        file.write(",".join(RESULT_COLUMNS) + "\n")
+        for chunk in chunks:
+            rows = _result_rows(*solve(chunk[:, 0], chunk[:, 1], chunk[:, 2]))
+            np.savetxt(file, rows, delimiter=",", fmt="%.17g")
+            written += len(rows)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve a file of quadratic equations a, b, c")
+    parser.add_argument("input", help="a .csv or .npy file of a, b, c rows")
+    parser.add_argument("output", help="a .csv or .npy file for discriminants and roots")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+    count = solve_file(args.input, args.output, args.chunk_size)
+    print(f"Solved {count} equations into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Quiz attempt logging and one-pass question difficulty analytics.
+
+Every answered question is appended to a binary log as a fixed header
+followed by the (normalized, truncated) answer text; every finished quiz
+adds one summary record with the score. Lesson ids are stored as their
+LessonIndex bit position, kept stable in a table file next to the log.
+Records carry no framing, so before its first append AttemptLog cuts off a
+torn record left by a crash mid-write; otherwise every later record would
+be read out of alignment.
+
+    python quiz_analytics.py quiz_attempts.bin --top 3
+"""
+import argparse
+import os
+import struct
+import time
+import zlib
+
+from answer_matching import normalize
+from lesson_progress import LessonIndex
+
+# type, timestamp, user crc32, lesson position, question/total, correct/score, answer length
+RECORD = struct.Struct("<BIIHBBB")
+ANSWER_RECORD = 0
+ATTEMPT_RECORD = 1
+MAX_ANSWER_BYTES = 64
+
+
+class AttemptLog:
+    """Append-only binary log of quiz answers and quiz scores."""
+    def __init__(self, path, lessons=None):
+        self.path = path
+        self.lesson_index = LessonIndex(lessons or {}, path + ".lessons.json")
+        self._repaired = False
+
+    def _repair(self):
+        """Truncate the log after its last complete record."""
+        try:
+            with open(self.path, "rb+") as file:
+                good_end = 0
+                for good_end, _ in _scan(file):
+                    pass
+                file.truncate(good_end)
+        except FileNotFoundError:
+            pass
+
+    def record_attempt(self, username, lesson_id, results):
+        """Log one finished quiz; results is a list of (given_answer, was_correct)."""
+        now = int(time.time())
+        user = zlib.crc32(username.encode())
+        lesson = self.lesson_index.position(lesson_id)
+        chunks = []
+        for question, (given, correct) in enumerate(results):
+            answer = normalize(given).encode()[:MAX_ANSWER_BYTES]
+            chunks.append(RECORD.pack(ANSWER_RECORD, now, user, lesson, question, bool(correct), len(answer)))
+            chunks.append(answer)
+        score = sum(1 for _, correct in results if correct)
+        chunks.append(RECORD.pack(ATTEMPT_RECORD, now, user, lesson, len(results), score, 0))
+        try:
+            if not self._repaired:
+                self._repair()
+                self._repaired = True
+            with open(self.path, "ab") as file:
+                file.write(b"".join(chunks))
+        except IOError as e:
+            print(f"Error saving quiz attempt: {e}")
+
+
+def _scan(file):
+    """Yield (end offset, record) for each complete record; stops at a torn tail."""
+    end = 0
+    while True:
+        header = file.read(RECORD.size)
+        if len(header) < RECORD.size:
+            return
+        kind, stamp, user, lesson, field_a, field_b, length = RECORD.unpack(header)
+        answer = file.read(length)
+        if len(answer) < length:
+            return
+        end += RECORD.size + length
+        yield end, (kind, stamp, user, lesson, field_a, field_b, answer.decode(errors="replace"))
+
+
+def read_records(path):
+    """Yield (type, timestamp, user, lesson_position, field_a, field_b, answer) from a log."""
+    with open(path, "rb") as file:
+        for _, record in _scan(file):
+            yield record
+
+
+class HeavyHitters:
+    """Misra-Gries summary: approximate top answers using at most k counters."""
+    def __init__(self, k=8):
+        self.k = k
+        self.counters = {}
+
+    def add(self, item):
+        if item in self.counters:
+            self.counters[item] += 1
+        elif len(self.counters) < self.k:
+            self.counters[item] = 1
+        else:
+            for key in list(self.counters):
+                self.counters[key] -= 1
+                if not self.counters[key]:
+                    del self.counters[key]
+
+    def top(self, n):
+        return sorted(self.counters.items(), key=lambda pair: -pair[1])[:n]
+
+
+def aggregate(path, sketch_size=8):
+    """One pass over the log; memory grows with lessons x questions, not with attempts."""
+    questions = {}
+    lessons = {}
+    for kind, _, _, lesson, field_a, field_b, answer in read_records(path):
+        if kind == ANSWER_RECORD:
+            stats = questions.get((lesson, field_a))
+            if stats is None:
+                stats = questions[(lesson, field_a)] = {"attempts": 0, "correct": 0, "answers": HeavyHitters(sketch_size)}
+            stats["attempts"] += 1
+            stats["correct"] += field_b
+            if not field_b:
+                stats["answers"].add(answer)
+        elif kind == ATTEMPT_RECORD:
+            stats = lessons.setdefault(lesson, {"attempts": 0, "passed": 0})
+            stats["attempts"] += 1
+            stats["passed"] += field_b == field_a
+    return questions, lessons
+
+
+def report(path, top=3):
+    questions, lessons = aggregate(path)
+    index = LessonIndex({}, path + ".lessons.json")
+    ids = {position: lesson_id for lesson_id, position in index.positions.items()}
+
+    print("--- Lesson pass rates ---")
+    for lesson, stats in sorted(lessons.items()):
+        rate = 100 * stats["passed"] / stats["attempts"]
+        print(f"Lesson {ids.get(lesson, lesson)}: {rate:.1f}% of {stats['attempts']} attempts passed")
+
+    print("\n--- Question accuracy (hardest first) ---")
+    ranked = sorted(questions.items(), key=lambda item: item[1]["correct"] / item[1]["attempts"])
+    for (lesson, question), stats in ranked:
+        accuracy = 100 * stats["correct"] / stats["attempts"]
+        wrong = ", ".join(f"'{answer}' x{count}" for answer, count in stats["answers"].top(top))
+        print(f"Lesson {ids.get(lesson, lesson)} Q{question + 1}: {accuracy:.1f}% correct"
+              + (f" (common wrong answers: {wrong})" if wrong else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report question difficulty from a quiz attempt log")
+    parser.add_argument("log", nargs="?", default="quiz_attempts.bin")
+    parser.add_argument("--top", type=int, default=3, help="wrong answers to show per question")
+    args = parser.parse_args()
+    if not os.path.exists(args.log):
+        print(f"No attempt log found at '{args.log}'.")
+        return
+    report(args.log, args.top)
+
+
+if __name__ == "__main__":
+    main()
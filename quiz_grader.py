@@ -0,0 +1,135 @@
+"""Batch grading of quiz submissions for the Python learning program.
+
+The submissions file is JSON lines, one attempt per line:
+
+    {"user": "alice", "lesson_id": "3", "answers": ["str", "float", "yes", "boolean", "int"]}
+
+Rows are read in chunks and graded in a process pool against answer keys
+compiled once up front (see answer_matching). Per-user totals are then written back through
+UserManager in one batch, and optionally to a CSV of per-user scores.
+
+    python quiz_grader.py submissions.jsonl --workers 8 --scores-out scores.csv
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from answer_matching import compile_quiz
+from python_learn import UserManager, lesson_store
+
+_answer_keys = {}
+
+
+def build_answer_keys(store):
+    keys = {}
+    for entries in store.catalog.values():
+        for lesson_id in entries:
+            keys[lesson_id] = tuple(compile_quiz(store.load(lesson_id)["quiz"]))
+    return keys
+
+
+def _init_worker(answer_keys):
+    global _answer_keys
+    _answer_keys = answer_keys
+
+
+def grade_chunk(lines):
+    """Grade raw JSON lines; returns (results, bad_rows) with results as (user, lesson_id, correct, total)."""
+    results = []
+    bad_rows = 0
+    for line in lines:
+        # A malformed row is counted and skipped; it must never fail the whole job.
+        try:
+            row = json.loads(line)
+            key = _answer_keys[row["lesson_id"]]
+            answers = row["answers"]
+            user = row["user"]
+            if not isinstance(answers, list) or not isinstance(user, str):
+                raise TypeError("answers must be a list and user a string")
+            correct = sum(1 for expected, given in zip(key, answers) if expected.matches(given))
+        except (ValueError, KeyError, TypeError):
+            bad_rows += 1
+            continue
+        results.append((user, row["lesson_id"], correct, len(key)))
+    return results, bad_rows
+
+
+def _chunks(path, chunk_size):
+    with open(path, "r") as file:
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                return
+            chunk = [line for line in lines if line.strip()]
+            if chunk:
+                yield chunk
+
+
+def grade_file(path, workers=None, chunk_size=10000, answer_keys=None):
+    """Grade every submission in path; returns {user: {"correct", "total", "completed"}} and a bad-row count."""
+    answer_keys = answer_keys or build_answer_keys(lesson_store)
+    workers = workers or os.cpu_count() or 1
+    totals = {}
+    bad_rows = 0
+
+    def merge(chunk_result):
+        nonlocal bad_rows
+        results, bad = chunk_result
+        bad_rows += bad
+        for user, lesson_id, correct, total in results:
+            entry = totals.get(user)
+            if entry is None:
+                entry = totals[user] = {"correct": 0, "total": 0, "completed": set()}
+            entry["correct"] += correct
+            entry["total"] += total
+            if correct == total:
+                entry["completed"].add(lesson_id)
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(answer_keys,)) as pool:
+        # Keep a bounded number of chunks in flight so huge files stream.
+        pending = []
+        for chunk in _chunks(path, chunk_size):
+            pending.append(pool.submit(grade_chunk, chunk))
+            if len(pending) >= workers * 2:
+                merge(pending.pop(0).result())
+        for future in pending:
+            merge(future.result())
+    return totals, bad_rows
+
+
+def write_scores(totals, path):
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["user", "correct", "total", "accuracy", "completed_lessons"])
+        for user, entry in sorted(totals.items()):
+            accuracy = round(100 * entry["correct"] / entry["total"], 1) if entry["total"] else 0
+            writer.writerow([user, entry["correct"], entry["total"], accuracy, " ".join(sorted(entry["completed"]))])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grade a file of quiz submissions")
+    parser.add_argument("submissions")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--scores-out", default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    totals, bad_rows = grade_file(args.submissions, args.workers, args.chunk_size)
+    graded = time.perf_counter() - start
+
+    UserManager.load_users()
+    updated = UserManager.record_quiz_results(totals)
+    if args.scores_out:
+        write_scores(totals, args.scores_out)
+
+    print(f"Graded {len(totals)} users in {graded:.2f}s ({bad_rows} bad rows skipped).")
+    print(f"Updated {updated} existing users.")
+
+
+if __name__ == "__main__":
+    main()
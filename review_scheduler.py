@@ -0,0 +1,127 @@
+"""SM-2 style spaced-repetition scheduling for completed lessons.
+
+Each completed lesson of a user carries a review record stored in the
+user's data under "reviews":
+
+    {"ease": 2.5, "interval": 1.0, "reps": 0, "due": <unix time>}
+
+ReviewQueue keeps one heap of (due, lesson_id) per user so the next due
+review is found in O(log n). Outdated heap entries are skipped lazily by
+comparing against the review record. due_counts answers "how many reviews
+are due" for every user at once for daily batch jobs.
+"""
+import heapq
+import time
+
+try:
+    import numpy as np
+except ImportError:  # due_counts falls back to a Python loop
+    np = None
+
+DAY = 24 * 60 * 60
+MIN_EASE = 1.3
+
+
+def new_review(now=None):
+    now = time.time() if now is None else now
+    return {"ease": 2.5, "interval": 1.0, "reps": 0, "due": now + DAY}
+
+
+def backfill_reviews(record, now=None):
+    """Give each completed lesson that has no review record one that is due now.
+
+    Lessons completed before scheduling existed would otherwise never come
+    up for review. Returns the number of review records added.
+    """
+    now = time.time() if now is None else now
+    progress = record.get("progress", {})
+    reviews = record.get("reviews", {})
+    missing = [lesson_id for lesson_id in progress if lesson_id not in reviews]
+    if missing:
+        reviews = record.setdefault("reviews", {})
+        for lesson_id in missing:
+            reviews[lesson_id] = new_review(now - DAY)
+    return len(missing)
+
+
+def sm2_update(review, quality, now=None):
+    """Update a review record in place for a recall quality from 0 (forgot) to 5 (perfect)."""
+    now = time.time() if now is None else now
+    quality = max(0, min(5, quality))
+    if quality < 3:
+        review["reps"] = 0
+        review["interval"] = 1.0
+    else:
+        review["reps"] += 1
+        if review["reps"] == 1:
+            review["interval"] = 1.0
+        elif review["reps"] == 2:
+            review["interval"] = 6.0
+        else:
+            review["interval"] = round(review["interval"] * review["ease"], 2)
+    review["ease"] = max(MIN_EASE, review["ease"] + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    review["due"] = now + review["interval"] * DAY
+    return review
+
+
+def quiz_quality(correct, total):
+    """Map a quiz score onto the 0-5 SM-2 quality scale."""
+    return round(5 * correct / total) if total else 0
+
+
+class ReviewQueue:
+    """Per-user priority queues of lessons ordered by next review time."""
+    def __init__(self, users):
+        self.users = users
+        self.heaps = {}
+        for username, data in users.items():
+            heap = [(review["due"], lesson_id) for lesson_id, review in data.get("reviews", {}).items()]
+            heapq.heapify(heap)
+            self.heaps[username] = heap
+
+    def push(self, username, lesson_id, due):
+        heapq.heappush(self.heaps.setdefault(username, []), (due, lesson_id))
+
+    def _peek(self, username):
+        heap = self.heaps.get(username, [])
+        reviews = self.users.get(username, {}).get("reviews", {})
+        while heap:
+            due, lesson_id = heap[0]
+            review = reviews.get(lesson_id)
+            if review is not None and review["due"] == due:
+                return due, lesson_id
+            heapq.heappop(heap)  # superseded by a later review
+        return None
+
+    def next_due(self, username, now=None):
+        """Lesson id the user should review now, or None if nothing is due."""
+        now = time.time() if now is None else now
+        top = self._peek(username)
+        if top is None or top[0] > now:
+            return None
+        return top[1]
+
+    def next_review_time(self, username):
+        top = self._peek(username)
+        return None if top is None else top[0]
+
+
+def due_counts(users, now=None):
+    """Number of due reviews for every user, returned as {username: count}."""
+    now = time.time() if now is None else now
+    names = list(users)
+    if np is None:
+        return {
+            name: sum(1 for review in users[name].get("reviews", {}).values() if review["due"] <= now)
+            for name in names
+        }
+    owners = []
+    dues = []
+    for i, name in enumerate(names):
+        reviews = users[name].get("reviews", {})
+        owners.extend([i] * len(reviews))
+        dues.extend(review["due"] for review in reviews.values())
+    owners = np.asarray(owners, dtype=np.int64)
+    dues = np.asarray(dues, dtype=np.float64)
+    counts = np.bincount(owners[dues <= now], minlength=len(names))
+    return dict(zip(names, counts.tolist()))
@@ -0,0 +1,79 @@
+"""Sharded on-disk storage of user records for multi-process access.
+
+Users are spread over `count` JSON files by crc32(username). Writers lock
+a shard with an fcntl advisory lock, re-read it, merge in only the records
+they changed and atomically rename a new copy into place, so processes
+serving different users never overwrite each other's changes. Where fcntl
+is unavailable (Windows) the rename is still atomic but unlocked.
+"""
+import json
+import os
+import zlib
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class ShardedUserStore:
+    def __init__(self, directory, count=16):
+        self.directory = directory
+        self.count = count
+        os.makedirs(directory, exist_ok=True)
+
+    def shard_of(self, username):
+        return zlib.crc32(username.encode()) % self.count
+
+    def _path(self, shard):
+        return os.path.join(self.directory, f"shard-{shard:03d}.json")
+
+    @contextmanager
+    def _locked(self, shard, exclusive):
+        with open(self._path(shard) + ".lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self, shard):
+        try:
+            with open(self._path(shard), "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, shard, records):
+        temp_file = f"{self._path(shard)}.{os.getpid()}.tmp"
+        with open(temp_file, "w") as file:
+            json.dump(records, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, self._path(shard))
+
+    def load_all(self):
+        users = {}
+        for shard in range(self.count):
+            with self._locked(shard, exclusive=False):
+                users.update(self._read(shard))
+        return users
+
+    def load_user(self, username):
+        shard = self.shard_of(username)
+        with self._locked(shard, exclusive=False):
+            return self._read(shard).get(username)
+
+    def save(self, records):
+        """Merge {username: record} into their shards; other users in each shard are kept."""
+        by_shard = {}
+        for username, record in records.items():
+            by_shard.setdefault(self.shard_of(username), {})[username] = record
+        for shard, changed in by_shard.items():
+            with self._locked(shard, exclusive=True):
+                current = self._read(shard)
+                current.update(changed)
+                self._write(shard, current)